@@ -1,12 +1,41 @@
 """GTO preflop range charts and queries."""
 
 import json
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 from .range_parser import RANKS, RANK_VALUES, RangeParser
 from ..config import GTO_RANGES_FILE
 
 
+def matrix_hand(row: int, col: int) -> str:
+    """
+    Get the hand string for a 13x13 matrix position.
+
+    Args:
+        row: Row index (0-12)
+        col: Column index (0-12)
+
+    Returns:
+        Hand string (e.g., "AA", "AKs", "AKo"), or "" for an invalid position
+    """
+    if row < 0 or row > 12 or col < 0 or col > 12:
+        return ""
+
+    r1 = RANKS[row]
+    r2 = RANKS[col]
+
+    if row == col:
+        # Pair
+        return r1 + r2
+    elif row < col:
+        # Suited (above diagonal)
+        return r1 + r2 + "s"
+    else:
+        # Offsuit (below diagonal)
+        return r2 + r1 + "o"
+
+
 class GTOCharts:
     """Load and query GTO preflop ranges."""
 
@@ -110,37 +139,64 @@ class GTOCharts:
         # Initialize 13x13 matrix with False
         matrix = [[False for _ in range(13)] for _ in range(13)]
 
-        hands_upper = {h.upper() for h in hands}
-
-        for hand in hands_upper:
-            if len(hand) == 2:
-                # Pair (e.g., AA, KK)
-                rank = hand[0]
-                idx = RANK_VALUES.get(rank, -1)
-                if idx >= 0:
-                    matrix[idx][idx] = True
-
-            elif len(hand) == 3:
-                r1, r2, suit = hand[0], hand[1], hand[2].lower()
-                r1_idx = RANK_VALUES.get(r1, -1)
-                r2_idx = RANK_VALUES.get(r2, -1)
-
-                if r1_idx >= 0 and r2_idx >= 0:
-                    # Ensure high card in row, low card in col for suited
-                    # Swap for offsuit (below diagonal)
-                    if suit == "s":
-                        # Suited: row < col (above diagonal)
-                        row = min(r1_idx, r2_idx)
-                        col = max(r1_idx, r2_idx)
-                    else:
-                        # Offsuit: row > col (below diagonal)
-                        row = max(r1_idx, r2_idx)
-                        col = min(r1_idx, r2_idx)
-
-                    matrix[row][col] = True
+        for hand in {h.upper() for h in hands}:
+            cell = self._hand_cell(hand)
+            if cell is not None:
+                row, col = cell
+                matrix[row][col] = True
 
         return matrix
 
+    def hands_to_bitmask(self, hands: List[str]) -> int:
+        """
+        Convert a list of hands to a packed 169-bit matrix.
+
+        Uses the same layout as hands_to_matrix; the cell at (row, col) is
+        bit ``row * 13 + col``.
+
+        Args:
+            hands: List of hand strings
+
+        Returns:
+            Integer bitmask where a set bit = hand in range
+        """
+        mask = 0
+        for hand in hands:
+            cell = self._hand_cell(hand.upper())
+            if cell is not None:
+                row, col = cell
+                mask |= 1 << (row * 13 + col)
+        return mask
+
+    def _hand_cell(self, hand: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the matrix (row, col) for an upper-cased hand string.
+
+        Returns:
+            (row, col) tuple, or None if the hand cannot be placed
+        """
+        if len(hand) == 2:
+            # Pair (e.g., AA, KK)
+            idx = RANK_VALUES.get(hand[0], -1)
+            if idx >= 0:
+                return idx, idx
+
+        elif len(hand) == 3:
+            r1, r2, suit = hand[0], hand[1], hand[2].lower()
+            r1_idx = RANK_VALUES.get(r1, -1)
+            r2_idx = RANK_VALUES.get(r2, -1)
+
+            if r1_idx >= 0 and r2_idx >= 0:
+                # Ensure high card in row, low card in col for suited
+                # Swap for offsuit (below diagonal)
+                if suit == "s":
+                    # Suited: row < col (above diagonal)
+                    return min(r1_idx, r2_idx), max(r1_idx, r2_idx)
+                # Offsuit: row > col (below diagonal)
+                return max(r1_idx, r2_idx), min(r1_idx, r2_idx)
+
+        return None
+
     def get_matrix_hand(self, row: int, col: int) -> str:
         """
         Get the hand string for a matrix position.
@@ -152,21 +208,7 @@ class GTOCharts:
         Returns:
             Hand string (e.g., "AA", "AKs", "AKo")
         """
-        if row < 0 or row > 12 or col < 0 or col > 12:
-            return ""
-
-        r1 = RANKS[row]
-        r2 = RANKS[col]
-
-        if row == col:
-            # Pair
-            return r1 + r2
-        elif row < col:
-            # Suited (above diagonal)
-            return r1 + r2 + "s"
-        else:
-            # Offsuit (below diagonal)
-            return r2 + r1 + "o"
+        return matrix_hand(row, col)
 
     def get_combo_count(self, row: int, col: int) -> int:
         """
@@ -199,15 +241,21 @@ class GTOCharts:
         return self.parser.parse(notation)
 
 
+@lru_cache(maxsize=1)
+def get_charts() -> GTOCharts:
+    """Get the shared GTOCharts instance (the JSON file is loaded once)."""
+    return GTOCharts()
+
+
 def get_gto_range(position: str, action: str) -> Optional[Dict[str, Any]]:
     """Convenience function to get a GTO range."""
-    charts = GTOCharts()
+    charts = get_charts()
     return charts.get_range(position, action)
 
 
 def get_range_matrix(position: str, action: str) -> Optional[List[List[bool]]]:
     """Convenience function to get a range as a 13x13 matrix."""
-    charts = GTOCharts()
+    charts = get_charts()
     rangedata = charts.get_range(position, action)
     if not rangedata:
         return None
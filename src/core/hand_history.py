@@ -1,5 +1,6 @@
 """Hand history core logic for card formatting, validation, and pattern analysis."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 # Position constants
@@ -48,10 +49,13 @@ VALID_RANKS = set("23456789TJQKA")
 VALID_SUITS = set("shdc")
 
 
+@lru_cache(maxsize=4096)
 def format_cards(card_string: str) -> str:
     """
     Format a card string with Unicode suit symbols.
 
+    Cached per card string, so re-rendering the same hands skips the parsing.
+
     Args:
         card_string: Cards like "As Kh" or "Qh Jh 2c"
 
@@ -467,6 +471,19 @@ def analyze_hand_patterns(hands: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=1024)
+def _board_streets(board: str) -> Tuple[str, str, str]:
+    """Format a board as (flop, turn, river), once per distinct board string."""
+    if not board or not board.strip():
+        return "", "", ""
+
+    cards = board.strip().split()
+    flop = format_cards(" ".join(cards[:3])) if len(cards) >= 3 else ""
+    turn = format_cards(cards[3]) if len(cards) >= 4 else ""
+    river = format_cards(cards[4]) if len(cards) >= 5 else ""
+    return flop, turn, river
+
+
 def format_board_by_street(board: str) -> Dict[str, str]:
     """
     Format a board by street (flop, turn, river).
@@ -475,27 +492,11 @@ def format_board_by_street(board: str) -> Dict[str, str]:
         board: Full board like "Qh Jh 2c 5d 9s"
 
     Returns:
-        Dict with formatted cards for each street
+        Dict with formatted cards for each street (a new dict on every call,
+        so callers may modify it)
     """
-    if not board or not board.strip():
-        return {"flop": "", "turn": "", "river": ""}
-
-    cards = board.strip().split()
-
-    result = {
-        "flop": "",
-        "turn": "",
-        "river": "",
-    }
-
-    if len(cards) >= 3:
-        result["flop"] = format_cards(" ".join(cards[:3]))
-    if len(cards) >= 4:
-        result["turn"] = format_cards(cards[3])
-    if len(cards) >= 5:
-        result["river"] = format_cards(cards[4])
-
-    return result
+    flop, turn, river = _board_streets(board)
+    return {"flop": flop, "turn": turn, "river": river}
 
 
 def get_hand_summary(hand: Dict[str, Any]) -> str:
@@ -1,7 +1,8 @@
 """Session tracker core logic for bankroll and performance analysis."""
 
 import math
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
 
 import plotext as plt
 
@@ -64,17 +65,22 @@ def calculate_sharpe_ratio(
     return (mean_profit - risk_free_rate) / std_dev
 
 
-def calculate_max_drawdown(cumulative_profits: List[float]) -> Dict[str, float]:
+def calculate_max_drawdown(cumulative_profits: Iterable[float]) -> Dict[str, float]:
     """
     Calculate maximum drawdown from peak.
 
+    The values are consumed in a single pass, so a generator can be passed
+    instead of a materialized list.
+
     Args:
-        cumulative_profits: List of cumulative profit values over time
+        cumulative_profits: Cumulative profit values over time
 
     Returns:
         Dict with max_drawdown, max_drawdown_pct, peak, trough
     """
-    if not cumulative_profits:
+    values = iter(cumulative_profits)
+    first = next(values, None)
+    if first is None:
         return {
             "max_drawdown": 0.0,
             "max_drawdown_pct": 0.0,
@@ -82,18 +88,17 @@ def calculate_max_drawdown(cumulative_profits: List[float]) -> Dict[str, float]:
             "trough": 0.0,
         }
 
-    peak = cumulative_profits[0]
+    peak = first
     max_drawdown = 0.0
-    trough = cumulative_profits[0]
     peak_at_max_dd = peak
-    trough_at_max_dd = trough
+    trough_at_max_dd = first
 
-    for value in cumulative_profits:
+    for value in values:
         if value > peak:
+            # A new high can never be the bottom of a drawdown
             peak = value
-        drawdown = peak - value
-        if drawdown > max_drawdown:
-            max_drawdown = drawdown
+        elif peak - value > max_drawdown:
+            max_drawdown = peak - value
             peak_at_max_dd = peak
             trough_at_max_dd = value
 
@@ -109,6 +114,31 @@ def calculate_max_drawdown(cumulative_profits: List[float]) -> Dict[str, float]:
     }
 
 
+@lru_cache(maxsize=32)
+def _session_result_stats(profits: Tuple[float, ...]) -> Tuple[float, float, float]:
+    """
+    Stake-independent statistics for a set of session results.
+
+    Cached on the profit values themselves, so repeated bankroll checks over
+    the same sessions (e.g. at different stakes) reuse the variance work.
+
+    Args:
+        profits: Session profit/loss values
+
+    Returns:
+        Tuple of (win_rate, variance, std_deviation); win_rate is 50.0 when
+        there are no sessions
+    """
+    if not profits:
+        return 50.0, 0.0, 0.0
+
+    winning_sessions = sum(1 for p in profits if p > 0)
+    win_rate = winning_sessions / len(profits) * 100
+    variance = calculate_variance(list(profits))
+    std_dev = math.sqrt(variance) if variance > 0 else 0.0
+    return win_rate, variance, std_dev
+
+
 def analyze_bankroll_health(
     current_bankroll: float,
     stake_big_blind: float,
@@ -123,7 +153,7 @@ def analyze_bankroll_health(
         sessions: List of session data dicts
 
     Returns:
-        Dict with health metrics and recommendations
+        Dict with health metrics (rounded for display) and recommendations
     """
     if current_bankroll <= 0 or stake_big_blind <= 0:
         return {
@@ -139,16 +169,10 @@ def analyze_bankroll_health(
     buyins_available = current_bankroll / buyin_amount
 
     # Extract profits for variance calculation
-    profits = [
-        s.get("profit_loss", 0) for s in sessions if s.get("profit_loss") is not None
-    ]
-
-    # Calculate win rate
-    if profits:
-        winning_sessions = sum(1 for p in profits if p > 0)
-        win_rate = winning_sessions / len(profits) * 100
-    else:
-        win_rate = 50.0
+    profits = tuple(
+        s["profit_loss"] for s in sessions if s.get("profit_loss") is not None
+    )
+    win_rate, variance, std_dev = _session_result_stats(profits)
 
     # Simplified risk of ruin calculation
     # Based on win rate and bankroll in buyins
@@ -187,7 +211,6 @@ def analyze_bankroll_health(
             f"Your win rate ({win_rate:.1f}%) suggests reviewing your strategy."
         )
 
-    std_dev = calculate_standard_deviation(profits) if profits else 0
     if std_dev > buyin_amount * 2:
         recommendations.append("High variance detected. Consider tightening your game.")
 
@@ -214,37 +237,32 @@ def analyze_bankroll_health(
             recommended_stakes.append(name)
 
     return {
-        "buyins_available": buyins_available,
-        "risk_of_ruin": risk_of_ruin,
+        "buyins_available": round(buyins_available, 1),
+        "risk_of_ruin": round(risk_of_ruin, 1),
         "recommended_stakes": (
             recommended_stakes[-3:] if recommended_stakes else ["Move down"]
         ),
         "health_status": health_status,
         "win_rate": win_rate if profits else None,
-        "variance": calculate_variance(profits) if profits else 0,
-        "std_deviation": std_dev,
+        "variance": round(variance, 2),
+        "std_deviation": round(std_dev, 2),
         "recommendations": recommendations,
     }
 
 
-def calculate_streak_info(profits: List[float]) -> Dict[str, Any]:
+def calculate_streak_info(profits: Iterable[float]) -> Dict[str, Any]:
     """
     Calculate winning/losing streak information.
 
+    The values are consumed in a single pass, so a generator can be passed
+    instead of a materialized list.
+
     Args:
-        profits: List of session profit/loss values (in chronological order)
+        profits: Session profit/loss values (in chronological order)
 
     Returns:
         Dict with current_streak, longest_win_streak, longest_loss_streak
     """
-    if not profits:
-        return {
-            "current_streak": 0,
-            "current_streak_type": "none",
-            "longest_win_streak": 0,
-            "longest_loss_streak": 0,
-        }
-
     current_streak = 0
     current_type = "none"
     longest_win = 0
@@ -257,30 +275,17 @@ def calculate_streak_info(profits: List[float]) -> Dict[str, Any]:
             temp_win += 1
             temp_loss = 0
             longest_win = max(longest_win, temp_win)
+            current_streak, current_type = temp_win, "win"
         elif profit < 0:
             temp_loss += 1
             temp_win = 0
             longest_loss = max(longest_loss, temp_loss)
+            current_streak, current_type = temp_loss, "loss"
         else:
+            # Break-even ends a run, but trailing ones keep the current streak
             temp_win = 0
             temp_loss = 0
 
-    # Current streak (from the end)
-    for profit in reversed(profits):
-        if current_type == "none":
-            if profit > 0:
-                current_type = "win"
-                current_streak = 1
-            elif profit < 0:
-                current_type = "loss"
-                current_streak = 1
-        elif current_type == "win" and profit > 0:
-            current_streak += 1
-        elif current_type == "loss" and profit < 0:
-            current_streak += 1
-        else:
-            break
-
     return {
         "current_streak": current_streak,
         "current_streak_type": current_type,
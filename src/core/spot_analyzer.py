@@ -52,7 +52,8 @@ class SpotAnalyzer:
                 - hand_strength: Current hand evaluation
                 - equity: Win probability estimate
                 - outs: List of improving cards
-                - pot_odds: Required equity to call (percentage)
+                - pot_odds: Required equity to call (percentage) and whether
+                  hero's equity makes a direct call profitable
                 - implied_odds: Estimated implied odds
                 - spr: Stack-to-pot ratio
                 - ev: Expected value calculations (call/fold/raise)
@@ -110,6 +111,7 @@ class SpotAnalyzer:
                 "percentage": pot_odds,
                 "ratio": poker_math.percentage_to_ratio(pot_odds),
                 "required_equity": pot_odds,
+                "profitable": result["equity"] >= pot_odds,
             }
         else:
             result["pot_odds"] = None
@@ -263,7 +265,7 @@ class SpotAnalyzer:
         required_equity = pot_odds["required_equity"]
 
         # Decision logic
-        if equity >= required_equity:
+        if pot_odds["profitable"]:
             # We have the odds to call
             if ev_analysis["call"] > 0:
                 recommendation["action"] = "CALL"
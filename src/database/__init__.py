@@ -23,8 +23,10 @@ from .service import (
     # Poker session functions
     delete_poker_session,
     get_bankroll_data,
+    get_distinct_stake_levels,
     get_poker_sessions,
     get_session_stats,
+    get_sessions_change_key,
     save_poker_session,
     update_poker_session,
 )
@@ -51,7 +53,9 @@ __all__ = [
     # Poker session service functions
     "save_poker_session",
     "get_poker_sessions",
+    "get_distinct_stake_levels",
     "get_session_stats",
+    "get_sessions_change_key",
     "get_bankroll_data",
     "delete_poker_session",
     "update_poker_session",
@@ -1,12 +1,14 @@
 """Database service layer for CRUD operations."""
 
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import csv
 import io
 import json
 
+from sqlalchemy import func
+
 from .db import SessionLocal
 from .models import HandHistory, PokerSession, QuizAttempt, QuizSession
 
@@ -354,6 +356,7 @@ def get_poker_sessions(
     stake_level: Optional[str] = None,
     game_type: Optional[str] = None,
     limit: int = 100,
+    chronological: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Get poker sessions for a user.
@@ -363,7 +366,8 @@ def get_poker_sessions(
         days: Number of days to look back (0 for all time)
         stake_level: Filter by stake level
         game_type: Filter by game type (cash, tournament)
-        limit: Maximum sessions to return
+        limit: Maximum sessions to return (always the most recent ones)
+        chronological: Return oldest first instead of newest first
 
     Returns:
         List of session records as dicts
@@ -383,6 +387,9 @@ def get_poker_sessions(
             query = query.filter(PokerSession.game_type == game_type)
 
         sessions = query.order_by(PokerSession.date.desc()).limit(limit).all()
+        if chronological:
+            # Flip the newest-first page so the limit still keeps the latest
+            sessions.reverse()
 
         return [
             {
@@ -443,6 +450,68 @@ def get_poker_session_by_id(session_id: int) -> Optional[Dict[str, Any]]:
         db.close()
 
 
+def get_distinct_stake_levels(user_id: int = 1) -> List[str]:
+    """
+    Get the stake levels a user has logged sessions at.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Sorted list of unique, non-empty stake levels
+    """
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(PokerSession.stake_level)
+            .filter(
+                PokerSession.user_id == user_id,
+                PokerSession.stake_level.isnot(None),
+                PokerSession.stake_level != "",
+            )
+            .distinct()
+            .order_by(PokerSession.stake_level)
+            .all()
+        )
+        return [row[0] for row in rows]
+    finally:
+        db.close()
+
+
+def get_sessions_change_key(user_id: int = 1, days: int = 30) -> Tuple[Any, ...]:
+    """
+    Get a cheap fingerprint of a user's sessions, for skipping unchanged stats.
+
+    Any save, edit or delete in the window (or a session ageing out of it)
+    changes the key, without loading the rows themselves.
+
+    Args:
+        user_id: User ID
+        days: Number of days to look back (0 for all time)
+
+    Returns:
+        Tuple of (session count, highest id, total profit, total minutes,
+        winning sessions)
+    """
+    db = SessionLocal()
+    try:
+        query = db.query(
+            func.count(PokerSession.id),
+            func.max(PokerSession.id),
+            func.sum(PokerSession.profit_loss),
+            func.sum(PokerSession.duration_minutes),
+            func.count(PokerSession.id).filter(PokerSession.profit_loss > 0),
+        ).filter(PokerSession.user_id == user_id)
+
+        if days > 0:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+            query = query.filter(PokerSession.date >= cutoff)
+
+        return tuple(query.one())
+    finally:
+        db.close()
+
+
 def get_session_stats(
     user_id: int = 1,
     days: int = 30,
@@ -458,7 +527,8 @@ def get_session_stats(
 
     Returns:
         Dict with total_sessions, total_profit, total_hours, hourly_rate,
-        win_rate, biggest_win, biggest_loss, by_stake, by_location
+        win_rate, biggest_win, biggest_loss, by_stake, by_location.
+        Dollar amounts are rounded to cents, hours and win_rate to one decimal.
     """
     db = SessionLocal()
     try:
@@ -505,17 +575,16 @@ def get_session_stats(
         winning = sum(1 for p in profits if p > 0)
         losing = sum(1 for p in profits if p < 0)
 
-        # By stake level
+        # By stake level, grouped from the rows already loaded
         by_stake: Dict[str, Dict[str, Any]] = {}
         for s in sessions:
             stake = cast(str, s.stake_level) if s.stake_level else "Unknown"
-            if stake not in by_stake:
-                by_stake[stake] = {"sessions": 0, "profit": 0.0, "hours": 0.0}
-            by_stake[stake]["sessions"] += 1
-            by_stake[stake]["profit"] += (
-                cast(float, s.profit_loss) if s.profit_loss else 0.0
-            )
-            by_stake[stake]["hours"] += (
+            totals = by_stake.get(stake)
+            if totals is None:
+                totals = by_stake[stake] = {"sessions": 0, "profit": 0.0, "hours": 0.0}
+            totals["sessions"] += 1
+            totals["profit"] += cast(float, s.profit_loss) if s.profit_loss else 0.0
+            totals["hours"] += (
                 (cast(int, s.duration_minutes) / 60) if s.duration_minutes else 0.0
             )
 
@@ -532,15 +601,17 @@ def get_session_stats(
 
         return {
             "total_sessions": len(sessions),
-            "total_profit": total_profit,
-            "total_hours": total_hours,
-            "hourly_rate": total_profit / total_hours if total_hours > 0 else 0.0,
-            "win_rate": (winning / len(sessions) * 100) if sessions else 0.0,
+            "total_profit": round(total_profit, 2),
+            "total_hours": round(total_hours, 1),
+            "hourly_rate": (
+                round(total_profit / total_hours, 2) if total_hours > 0 else 0.0
+            ),
+            "win_rate": round(winning / len(sessions) * 100, 1),
             "winning_sessions": winning,
             "losing_sessions": losing,
-            "biggest_win": max(profits) if profits else 0.0,
-            "biggest_loss": min(profits) if profits else 0.0,
-            "average_session": total_profit / len(sessions) if sessions else 0.0,
+            "biggest_win": round(max(profits), 2) if profits else 0.0,
+            "biggest_loss": round(min(profits), 2) if profits else 0.0,
+            "average_session": round(total_profit / len(sessions), 2),
             "by_stake": by_stake,
             "by_location": by_location,
         }
@@ -603,10 +674,10 @@ def get_bankroll_data(
 
         return {
             "data_points": data_points,
-            "current_bankroll": cumulative,
+            "current_bankroll": round(cumulative, 2),
             "starting_bankroll": 0.0,
-            "peak": peak,
-            "trough": trough,
+            "peak": round(peak, 2),
+            "trough": round(trough, 2),
         }
     finally:
         db.close()
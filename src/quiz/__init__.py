@@ -9,6 +9,7 @@ from .questions import (
     filter_questions,
     format_options,
     format_question_display,
+    format_topic_name,
     get_difficulties,
     get_option_from_label,
     get_topics,
@@ -24,6 +25,7 @@ __all__ = [
     "check_answer",
     "format_question_display",
     "format_options",
+    "format_topic_name",
     "get_option_from_label",
     "get_topics",
     "get_difficulties",
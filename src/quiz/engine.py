@@ -158,6 +158,18 @@ class QuizEngine:
             "time_taken": time_taken,
         }
 
+    def peek_next(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the question after the current one without advancing.
+
+        Returns:
+            Next question dict or None if the current question is the last
+        """
+        next_idx = self._current_idx + 1
+        if next_idx >= len(self._questions):
+            return None
+        return self._questions[next_idx]
+
     def next_question(self) -> Optional[Dict[str, Any]]:
         """
         Advance to the next question.
@@ -1,5 +1,6 @@
 """Quiz question types, validation, and formatting utilities."""
 
+from functools import lru_cache
 from typing import Any, Dict, List, Set
 
 # Valid topics for quiz questions
@@ -51,6 +52,10 @@ QUESTION_TYPES: List[str] = [
     "range_construction",
 ]
 
+# Letters used to label answer options, in order
+OPTION_LETTERS = "ABCDEFGHIJ"
+_LETTER_INDEX: Dict[str, int] = {letter: i for i, letter in enumerate(OPTION_LETTERS)}
+
 # Required fields for a valid question
 REQUIRED_FIELDS: Set[str] = {
     "id",
@@ -170,8 +175,21 @@ def format_options(options: List[str]) -> List[str]:
     Returns:
         List of formatted option strings (e.g., ["A) Fold", "B) Call"])
     """
-    labels = "ABCDEFGHIJ"
-    return [f"{labels[i]}) {opt}" for i, opt in enumerate(options)]
+    return [f"{OPTION_LETTERS[i]}) {opt}" for i, opt in enumerate(options)]
+
+
+@lru_cache(maxsize=256)
+def format_topic_name(topic: str) -> str:
+    """
+    Get the display name for a topic or difficulty key.
+
+    Args:
+        topic: Snake_case key (e.g., "pot_odds")
+
+    Returns:
+        Title-cased display name (e.g., "Pot Odds")
+    """
+    return topic.replace("_", " ").title()
 
 
 def get_option_from_label(options: List[str], label: str) -> str:
@@ -185,12 +203,9 @@ def get_option_from_label(options: List[str], label: str) -> str:
     Returns:
         Option text or empty string if invalid label
     """
-    labels = "ABCDEFGHIJ"
-    label = label.upper()
-    if label in labels:
-        idx = labels.index(label)
-        if idx < len(options):
-            return options[idx]
+    idx = _LETTER_INDEX.get(label.upper())
+    if idx is not None and idx < len(options):
+        return options[idx]
     return ""
 
 
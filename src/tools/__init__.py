@@ -5,44 +5,67 @@ with poker analysis, range queries, quiz statistics, session tracking, and
 hand history analysis.
 """
 
-from .hand_eval_tools import (
-    evaluate_hand,
-    calculate_equity,
-    analyze_spot,
-    HAND_EVAL_TOOLS,
-)
-from .range_tools import (
-    get_gto_range,
-    list_available_ranges,
-    parse_range,
-    check_hand_in_range,
-    RANGE_TOOLS,
-)
-from .quiz_tools import (
-    get_quiz_performance,
-    find_study_leaks,
-    get_recent_quiz_sessions,
-    add_quiz_question,
-    get_quiz_bank_stats,
-    QUIZ_TOOLS,
-)
-from .session_tools import (
-    get_session_statistics,
-    get_bankroll_analysis,
-    get_session_history,
-    get_bankroll_progression,
-    SESSION_TOOLS,
-)
-from .history_tools import (
-    search_hands,
-    get_hand_statistics,
-    analyze_patterns,
-    list_available_tags,
-    HISTORY_TOOLS,
+import importlib
+from typing import Any
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing one tool module (or this package)
+# does not pull in the database layer and every other tool group.
+_TOOL_MODULES = {
+    # Hand evaluation tools
+    "evaluate_hand": "hand_eval_tools",
+    "calculate_equity": "hand_eval_tools",
+    "analyze_spot": "hand_eval_tools",
+    "HAND_EVAL_TOOLS": "hand_eval_tools",
+    # Range tools
+    "get_gto_range": "range_tools",
+    "list_available_ranges": "range_tools",
+    "parse_range": "range_tools",
+    "check_hand_in_range": "range_tools",
+    "RANGE_TOOLS": "range_tools",
+    # Quiz tools
+    "get_quiz_performance": "quiz_tools",
+    "find_study_leaks": "quiz_tools",
+    "get_recent_quiz_sessions": "quiz_tools",
+    "add_quiz_question": "quiz_tools",
+    "get_quiz_bank_stats": "quiz_tools",
+    "QUIZ_TOOLS": "quiz_tools",
+    # Session tools
+    "get_session_statistics": "session_tools",
+    "get_bankroll_analysis": "session_tools",
+    "get_session_history": "session_tools",
+    "get_bankroll_progression": "session_tools",
+    "SESSION_TOOLS": "session_tools",
+    # History tools
+    "search_hands": "history_tools",
+    "get_hand_statistics": "history_tools",
+    "analyze_patterns": "history_tools",
+    "list_available_tags": "history_tools",
+    "HISTORY_TOOLS": "history_tools",
+}
+
+_TOOL_GROUPS = (
+    "HAND_EVAL_TOOLS",
+    "RANGE_TOOLS",
+    "QUIZ_TOOLS",
+    "SESSION_TOOLS",
+    "HISTORY_TOOLS",
 )
 
-# All tools combined for the agent
-ALL_TOOLS = HAND_EVAL_TOOLS + RANGE_TOOLS + QUIZ_TOOLS + SESSION_TOOLS + HISTORY_TOOLS
+
+def __getattr__(name: str) -> Any:
+    """Resolve tools lazily and cache them on the package."""
+    if name == "ALL_TOOLS":
+        # All tools combined for the agent
+        value: Any = [t for group in _TOOL_GROUPS for t in __getattr__(group)]
+    elif name in _TOOL_MODULES:
+        module = importlib.import_module(f".{_TOOL_MODULES[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Hand evaluation tools
@@ -78,3 +101,7 @@ __all__ = [
     # All tools
     "ALL_TOOLS",
 ]
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -4,7 +4,7 @@ from typing import Any
 
 from langchain_core.tools import tool
 
-from ..core.gto_charts import GTOCharts
+from ..core.gto_charts import get_charts
 from ..core.range_parser import RangeParser
 
 
@@ -40,7 +40,7 @@ def get_gto_range(position: str, action: str = "open") -> dict[str, Any]:
         get_gto_range("BTN", "open") -> {"hands": ["AA", "KK", ...], "percentage": 40.0, ...}
     """
     try:
-        charts = GTOCharts()
+        charts = get_charts()
 
         # Normalize position
         position = position.upper()
@@ -94,7 +94,7 @@ def list_available_ranges() -> dict[str, Any]:
         list_available_ranges() -> {"positions": {"UTG": ["open"], "BTN": ["open"], "BB": ["call_vs_BTN", "3bet_vs_BTN"], ...}}
     """
     try:
-        charts = GTOCharts()
+        charts = get_charts()
         positions = charts.get_positions()
 
         result = {}
@@ -169,7 +169,7 @@ def check_hand_in_range(
         check_hand_in_range("A5s", "BTN", "open") -> {"in_range": True, "range_percentage": 40.0, ...}
     """
     try:
-        charts = GTOCharts()
+        charts = get_charts()
         position = position.upper()
 
         # Validate position
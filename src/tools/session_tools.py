@@ -1,8 +1,10 @@
 """LangChain tools for poker session tracking and bankroll analysis (Mode 4)."""
 
+from itertools import accumulate
 from typing import Any, Optional
 
 from langchain_core.tools import tool
+from sqlalchemy.exc import SQLAlchemyError
 
 from ..database.service import (
     get_poker_sessions,
@@ -15,6 +17,25 @@ from ..core.session_tracker import (
     calculate_streak_info,
 )
 
+# Failures the tools report back to the agent instead of raising
+_TOOL_ERRORS = (SQLAlchemyError, KeyError, TypeError, ValueError)
+
+# Fields copied straight from get_session_stats (already rounded there)
+_STATS_KEYS = (
+    "total_sessions",
+    "total_profit",
+    "total_hours",
+    "hourly_rate",
+    "win_rate",
+    "winning_sessions",
+    "losing_sessions",
+    "biggest_win",
+    "biggest_loss",
+    "average_session",
+    "by_stake",
+    "by_location",
+)
+
 
 @tool
 def get_session_statistics(
@@ -53,20 +74,9 @@ def get_session_statistics(
             "success": True,
             "period_days": days if days > 0 else "all_time",
             "stake_filter": stake_level,
-            "total_sessions": stats["total_sessions"],
-            "total_profit": round(stats["total_profit"], 2),
-            "total_hours": round(stats["total_hours"], 1),
-            "hourly_rate": round(stats["hourly_rate"], 2),
-            "win_rate": round(stats["win_rate"], 1),
-            "winning_sessions": stats["winning_sessions"],
-            "losing_sessions": stats["losing_sessions"],
-            "biggest_win": round(stats["biggest_win"], 2),
-            "biggest_loss": round(stats["biggest_loss"], 2),
-            "average_session": round(stats["average_session"], 2),
-            "by_stake": stats["by_stake"],
-            "by_location": stats["by_location"],
+            **{key: stats[key] for key in _STATS_KEYS},
         }
-    except Exception as e:
+    except _TOOL_ERRORS as e:
         return {"success": False, "error": f"Error getting session stats: {str(e)}"}
 
 
@@ -111,16 +121,16 @@ def get_bankroll_analysis(
             "success": True,
             "current_bankroll": current_bankroll,
             "stake_big_blind": stake_big_blind,
-            "buyins_available": round(health["buyins_available"], 1),
-            "risk_of_ruin": round(health["risk_of_ruin"], 1),
+            "buyins_available": health["buyins_available"],
+            "risk_of_ruin": health["risk_of_ruin"],
             "recommended_stakes": health["recommended_stakes"],
             "health_status": health["health_status"],
             "win_rate": health.get("win_rate"),
-            "variance": round(health.get("variance", 0), 2),
-            "std_deviation": round(health.get("std_deviation", 0), 2),
+            "variance": health.get("variance", 0),
+            "std_deviation": health.get("std_deviation", 0),
             "recommendations": health["recommendations"],
         }
-    except Exception as e:
+    except _TOOL_ERRORS as e:
         return {"success": False, "error": f"Error analyzing bankroll: {str(e)}"}
 
 
@@ -175,7 +185,7 @@ def get_session_history(
             },
             "sessions": sessions,
         }
-    except Exception as e:
+    except _TOOL_ERRORS as e:
         return {"success": False, "error": f"Error getting sessions: {str(e)}"}
 
 
@@ -211,27 +221,27 @@ def get_bankroll_progression(days: int = 90) -> dict[str, Any]:
                 "current_bankroll": 0,
             }
 
-        # Calculate max drawdown
-        cumulative = [dp["cumulative"] for dp in bankroll_data["data_points"]]
-        drawdown = calculate_max_drawdown(cumulative)
+        data_points = bankroll_data["data_points"]
 
-        # Calculate streaks
-        profits = [dp["profit"] for dp in bankroll_data["data_points"]]
+        # Single walk over the data points; cumulative values are the
+        # running sum of profits, so drawdown is computed from them directly
+        profits = [dp["profit"] for dp in data_points]
+        drawdown = calculate_max_drawdown(accumulate(profits))
         streaks = calculate_streak_info(profits)
 
         return {
             "success": True,
             "period_days": days if days > 0 else "all_time",
-            "num_sessions": len(bankroll_data["data_points"]),
-            "current_bankroll": round(bankroll_data["current_bankroll"], 2),
-            "peak": round(bankroll_data["peak"], 2),
-            "trough": round(bankroll_data["trough"], 2),
+            "num_sessions": len(data_points),
+            "current_bankroll": bankroll_data["current_bankroll"],
+            "peak": bankroll_data["peak"],
+            "trough": bankroll_data["trough"],
             "max_drawdown": round(drawdown["max_drawdown"], 2),
             "max_drawdown_pct": round(drawdown["max_drawdown_pct"], 1),
             "streak_info": streaks,
-            "data_points": bankroll_data["data_points"][-10:],  # Last 10 for brevity
+            "data_points": data_points[-10:],  # Last 10 for brevity
         }
-    except Exception as e:
+    except _TOOL_ERRORS as e:
         return {"success": False, "error": f"Error getting bankroll data: {str(e)}"}
 
 
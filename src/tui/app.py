@@ -4,15 +4,6 @@ from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import Header, Footer, Button, Static
 from textual.binding import Binding
-from .screens import (
-    Mode1InputScreen,
-    Mode2InputScreen,
-    Mode3SetupScreen,
-    Mode4MenuScreen,
-    Mode5MenuScreen,
-    Mode6ChatScreen,
-    Mode7AdminScreen,
-)
 
 
 class WelcomeScreen(Static):
@@ -93,57 +84,56 @@ class PokerCoachApp(App):
         yield Container(WelcomeScreen())
         yield Footer()
 
+    _BUTTON_ACTIONS = {f"mode_{i}": f"action_mode_{i}" for i in range(1, 8)} | {
+        "quit": "exit"
+    }
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        button_id = event.button.id
-
-        if button_id == "quit":
-            self.exit()
-        elif button_id == "mode_1":
-            self.action_mode_1()
-        elif button_id == "mode_2":
-            self.action_mode_2()
-        elif button_id == "mode_3":
-            self.action_mode_3()
-        elif button_id == "mode_4":
-            self.action_mode_4()
-        elif button_id == "mode_5":
-            self.action_mode_5()
-        elif button_id == "mode_6":
-            self.action_mode_6()
-        elif button_id == "mode_7":
-            self.action_mode_7()
+        action = self._BUTTON_ACTIONS.get(event.button.id or "")
+        if action:
+            getattr(self, action)()
 
     def action_mode_1(self) -> None:
         """Open Mode 1: Hand Evaluator & Spot Analyzer."""
+        from .screens import Mode1InputScreen
 
         self.push_screen(Mode1InputScreen())
 
     def action_mode_2(self) -> None:
         """Open Mode 2: Range Tools."""
+        from .screens import Mode2InputScreen
 
         self.push_screen(Mode2InputScreen())
 
     def action_mode_3(self) -> None:
         """Open Mode 3: Quiz System."""
+        from .screens import Mode3SetupScreen
 
         self.push_screen(Mode3SetupScreen())
 
     def action_mode_4(self) -> None:
         """Open Mode 4: Session Tracker."""
+        from .screens import Mode4MenuScreen
 
         self.push_screen(Mode4MenuScreen())
 
     def action_mode_5(self) -> None:
         """Open Mode 5: Hand History Manager."""
+        from .screens import Mode5MenuScreen
+
         self.push_screen(Mode5MenuScreen())
 
     def action_mode_6(self) -> None:
         """Open Mode 6: AI Agent Coach."""
+        from .screens import Mode6ChatScreen
+
         self.push_screen(Mode6ChatScreen())
 
     def action_mode_7(self) -> None:
         """Open Mode 7: Admin Dashboard."""
+        from .screens import Mode7AdminScreen
+
         self.push_screen(Mode7AdminScreen())
 
 
@@ -1,43 +1,46 @@
-"""TUI screens for different modes."""
-
-from .mode1_input import Mode1InputScreen
-from .mode1_comprehensive import Mode1ComprehensiveScreen
-from .mode2_input import Mode2InputScreen
-from .mode2_matrix import Mode2MatrixScreen
-from .mode3_setup import Mode3SetupScreen
-from .mode3_quiz import Mode3QuizScreen
-from .mode3_results import Mode3ResultsScreen
-from .mode4_menu import Mode4MenuScreen
-from .mode4_entry import Mode4EntryScreen
-from .mode4_history import Mode4HistoryScreen
-from .mode4_stats import Mode4StatsScreen
-from .mode5_menu import Mode5MenuScreen
-from .mode5_entry import Mode5EntryScreen
-from .mode5_history import Mode5HistoryScreen
-from .mode5_detail import Mode5DetailScreen
-from .mode6_chat import Mode6ChatScreen
-from .mode7_admin import Mode7AdminScreen
-from .mode7_detail import Mode7DetailScreen
-from .mode4_detail import Mode4DetailScreen
-
-__all__ = [
-    "Mode1InputScreen",
-    "Mode1ComprehensiveScreen",
-    "Mode2InputScreen",
-    "Mode2MatrixScreen",
-    "Mode3SetupScreen",
-    "Mode3QuizScreen",
-    "Mode3ResultsScreen",
-    "Mode4MenuScreen",
-    "Mode4EntryScreen",
-    "Mode4HistoryScreen",
-    "Mode4StatsScreen",
-    "Mode5MenuScreen",
-    "Mode5EntryScreen",
-    "Mode5HistoryScreen",
-    "Mode5DetailScreen",
-    "Mode6ChatScreen",
-    "Mode7AdminScreen",
-    "Mode7DetailScreen",
-    "Mode4DetailScreen",
-]
+"""TUI screens for different modes.
+
+Screens are imported on first attribute access (PEP 562) so that loading the
+package does not pull in every mode's dependencies (database, LangChain, etc.).
+"""
+
+import importlib
+from typing import Any
+
+_SCREEN_MODULES = {
+    "Mode1InputScreen": "mode1_input",
+    "Mode1ComprehensiveScreen": "mode1_comprehensive",
+    "Mode2InputScreen": "mode2_input",
+    "Mode2MatrixScreen": "mode2_matrix",
+    "Mode3SetupScreen": "mode3_setup",
+    "Mode3QuizScreen": "mode3_quiz",
+    "Mode3ResultsScreen": "mode3_results",
+    "Mode4MenuScreen": "mode4_menu",
+    "Mode4EntryScreen": "mode4_entry",
+    "Mode4HistoryScreen": "mode4_history",
+    "Mode4StatsScreen": "mode4_stats",
+    "Mode4DetailScreen": "mode4_detail",
+    "Mode5MenuScreen": "mode5_menu",
+    "Mode5EntryScreen": "mode5_entry",
+    "Mode5HistoryScreen": "mode5_history",
+    "Mode5DetailScreen": "mode5_detail",
+    "Mode6ChatScreen": "mode6_chat",
+    "Mode7AdminScreen": "mode7_admin",
+    "Mode7DetailScreen": "mode7_detail",
+}
+
+__all__ = list(_SCREEN_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a screen class on first access and cache it on the package."""
+    module_name = _SCREEN_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    screen = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = screen
+    return screen
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,6 +1,10 @@
 """Mode 1: Comprehensive Analysis Screen."""
 
+from functools import lru_cache
 from typing import Optional, Dict, Any
+from rich.console import Group
+from rich.panel import Panel
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, VerticalScroll
@@ -9,6 +13,33 @@ from textual.binding import Binding
 
 from ...core.spot_analyzer import SpotAnalyzer
 
+_SUIT_SYMBOLS = {"s": "♠", "h": "♥", "d": "♦", "c": "♣"}
+
+
+def _section(title: str, body: str) -> Panel:
+    """Render one analysis section as a bordered panel."""
+    return Panel(
+        Text.from_markup(body),
+        title=f"[bold cyan]{title}[/bold cyan]",
+        title_align="left",
+        border_style="blue",
+        padding=(0, 1),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _fmt(cards: str) -> str:
+    """Format cards with suit symbols."""
+    result: list[str] = []
+    for card in cards.split():
+        if len(card) == 2:
+            result.append(
+                f"{card[0].upper()}{_SUIT_SYMBOLS.get(card[1].lower(), card[1])}"
+            )
+        else:
+            result.append(card)
+    return " ".join(result)
+
 
 class Mode1ComprehensiveScreen(Screen):
     """Display comprehensive hand analysis."""
@@ -38,42 +69,10 @@ class Mode1ComprehensiveScreen(Screen):
         padding: 0;
     }
 
-    .section {
-        width: 100%;
-        height: auto;
-        padding: 0 1;
-        margin: 0;
-        border: solid $primary;
-    }
-
-    .section-title {
-        color: $accent;
-        text-style: bold;
-        padding: 0;
-        margin: 0;
-    }
-
-    .line {
-        width: 100%;
-        padding: 0;
-        margin: 0;
-    }
-
-    .recommendation {
+    .analysis {
         width: 100%;
         height: auto;
-        padding: 1;
-        margin: 0;
-        border: solid $success;
-        background: $boost;
-    }
-
-    .rec-action {
-        text-align: center;
-        color: $success;
-        text-style: bold;
-        padding: 0;
-        margin: 0;
+        margin: 1 0 0 0;
     }
 
     .error {
@@ -144,8 +143,8 @@ class Mode1ComprehensiveScreen(Screen):
                 )
             elif self.result:
                 # Cards
-                yield Static(f"Hero: {self._fmt(self.hero_hand)}", classes="cards")
-                yield Static(f"Board: {self._fmt(self.board)}", classes="cards")
+                yield Static(f"Hero: {_fmt(self.hero_hand)}", classes="cards")
+                yield Static(f"Board: {_fmt(self.board)}", classes="cards")
 
                 # Situation info
                 if self.pot_size or self.bet_to_call or self.effective_stack:
@@ -158,106 +157,8 @@ class Mode1ComprehensiveScreen(Screen):
                         info.append(f"Stack: ${self.effective_stack}")
                     yield Static(" | ".join(info), classes="cards")
 
-                # Hand Strength
-                with Container(classes="section"):
-                    yield Static("HAND STRENGTH", classes="section-title")
-                    yield Static(
-                        self.result["hand_strength"]["description"], classes="line"
-                    )
-
-                # Equity & Outs
-                with Container(classes="section"):
-                    yield Static("EQUITY & OUTS", classes="section-title")
-                    yield Static(f"Equity: {self.result['equity']}%", classes="line")
-                    yield Static(
-                        f"Total Outs: {self.result['out_count']}", classes="line"
-                    )
-
-                    outs = self.result.get("outs", {})
-                    flush = outs.get("flush_draw", {})
-                    if flush.get("count", 0) > 0:
-                        flush_type = (
-                            "Backdoor Flush"
-                            if flush.get("type") == "backdoor_flush"
-                            else "Flush Draw"
-                        )
-                        yield Static(
-                            f"  • {flush_type}: {flush['count']} outs", classes="line"
-                        )
-
-                    straight = outs.get("straight_draw", {})
-                    if straight.get("count", 0) > 0:
-                        yield Static(
-                            f"  • Straight ({straight.get('type', '')}): {straight['count']} outs",
-                            classes="line",
-                        )
-
-                    overcards = outs.get("overcards", {})
-                    if overcards.get("count", 0) > 0:
-                        yield Static(
-                            f"  • Overcards: {overcards['count']} outs", classes="line"
-                        )
-
-                # Pot Odds (if available)
-                if self.result.get("pot_odds"):
-                    with Container(classes="section"):
-                        yield Static("POT ODDS", classes="section-title")
-                        po = self.result["pot_odds"]
-                        yield Static(
-                            f"Required Equity: {po['percentage']}% ({po['ratio']})",
-                            classes="line",
-                        )
-                        yield Static(
-                            f"Your Equity: {self.result['equity']}%", classes="line"
-                        )
-                        if self.result["equity"] >= po["percentage"]:
-                            yield Static(
-                                "✓ Profitable to call (direct odds)", classes="line"
-                            )
-                        else:
-                            yield Static(
-                                "✗ Not profitable (direct odds)", classes="line"
-                            )
-
-                # SPR (if available)
-                if self.result.get("spr") is not None:
-                    with Container(classes="section"):
-                        yield Static("STACK CONSIDERATIONS", classes="section-title")
-                        yield Static(
-                            f"SPR: {self.result['spr']} ({self.result['spr_category']})",
-                            classes="line",
-                        )
-
-                # EV (if available)
-                if self.result.get("ev"):
-                    with Container(classes="section"):
-                        yield Static("EXPECTED VALUE", classes="section-title")
-                        ev = self.result["ev"]
-                        if ev["call"] > 0:
-                            yield Static(
-                                f"EV of Call: [green]+${ev['call']:.2f}[/green]",
-                                classes="line",
-                            )
-                        else:
-                            yield Static(
-                                f"EV of Call: [red]${ev['call']:.2f}[/red]",
-                                classes="line",
-                            )
-                        yield Static(f"EV of Fold: ${ev['fold']:.2f}", classes="line")
-
-                # Recommendation
-                rec = self.result.get("recommendation", {})
-                with Container(classes="recommendation"):
-                    action = rec.get("action", "UNKNOWN")
-                    if action == "ANALYZE":
-                        yield Static("HAND ANALYSIS", classes="rec-action")
-                        yield Static(
-                            "Provide pot/bet for action recommendation", classes="line"
-                        )
-                    else:
-                        yield Static(f"RECOMMENDATION: {action}", classes="rec-action")
-                        for reason in rec.get("reasoning", []):
-                            yield Static(f"• {reason}", classes="line")
+                # Analysis sections, rendered as one widget
+                yield Static(self._analysis_panels(self.result), classes="analysis")
 
             # Buttons
             with Container(classes="buttons"):
@@ -282,13 +183,94 @@ class Mode1ComprehensiveScreen(Screen):
         self.app.pop_screen()
         self.app.pop_screen()
 
-    def _fmt(self, cards: str) -> str:
-        """Format cards with suit symbols."""
-        suits = {"s": "♠", "h": "♥", "d": "♦", "c": "♣"}
-        result: list[str] = []
-        for card in cards.split():
-            if len(card) == 2:
-                result.append(f"{card[0].upper()}{suits.get(card[1].lower(), card[1])}")
-            else:
-                result.append(card)
-        return " ".join(result)
+    def _analysis_panels(self, result: Dict[str, Any]) -> Group:
+        """Assemble every analysis section into a single renderable."""
+        panels = [
+            _section("HAND STRENGTH", result["hand_strength"]["description"]),
+            _section("EQUITY & OUTS", self._equity_lines(result)),
+        ]
+
+        # Pot Odds (if available)
+        if result.get("pot_odds"):
+            panels.append(_section("POT ODDS", self._pot_odds_lines(result)))
+
+        # SPR (if available)
+        if result.get("spr") is not None:
+            panels.append(
+                _section(
+                    "STACK CONSIDERATIONS",
+                    f"SPR: {result['spr']} ({result['spr_category']})",
+                )
+            )
+
+        # EV (if available)
+        if result.get("ev"):
+            panels.append(_section("EXPECTED VALUE", self._ev_lines(result)))
+
+        # Recommendation
+        rec = result.get("recommendation", {})
+        action = rec.get("action", "UNKNOWN")
+        if action == "ANALYZE":
+            heading = "HAND ANALYSIS"
+            body = "Provide pot/bet for action recommendation"
+        else:
+            heading = f"RECOMMENDATION: {action}"
+            body = "\n".join(f"• {reason}" for reason in rec.get("reasoning", []))
+        rec_body = Group(
+            Text(heading, style="bold green", justify="center"),
+            Text.from_markup(body),
+        )
+        panels.append(Panel(rec_body, border_style="green", padding=(1, 1)))
+
+        return Group(*panels)
+
+    def _equity_lines(self, result: Dict[str, Any]) -> str:
+        """Build the equity & outs section body as one markup block."""
+        lines = [
+            f"Equity: {result['equity']}%",
+            f"Total Outs: {result['out_count']}",
+        ]
+
+        outs = result.get("outs", {})
+        flush = outs.get("flush_draw", {})
+        if flush.get("count", 0) > 0:
+            flush_type = (
+                "Backdoor Flush"
+                if flush.get("type") == "backdoor_flush"
+                else "Flush Draw"
+            )
+            lines.append(f"  • {flush_type}: {flush['count']} outs")
+
+        straight = outs.get("straight_draw", {})
+        if straight.get("count", 0) > 0:
+            lines.append(
+                f"  • Straight ({straight.get('type', '')}): {straight['count']} outs"
+            )
+
+        overcards = outs.get("overcards", {})
+        if overcards.get("count", 0) > 0:
+            lines.append(f"  • Overcards: {overcards['count']} outs")
+
+        return "\n".join(lines)
+
+    def _pot_odds_lines(self, result: Dict[str, Any]) -> str:
+        """Build the pot odds section body as one markup block."""
+        po = result["pot_odds"]
+        lines = [
+            f"Required Equity: {po['percentage']}% ({po['ratio']})",
+            f"Your Equity: {result['equity']}%",
+        ]
+        if po["profitable"]:
+            lines.append("✓ Profitable to call (direct odds)")
+        else:
+            lines.append("✗ Not profitable (direct odds)")
+        return "\n".join(lines)
+
+    def _ev_lines(self, result: Dict[str, Any]) -> str:
+        """Build the expected value section body as one markup block."""
+        ev = result["ev"]
+        if ev["call"] > 0:
+            call_line = f"EV of Call: [green]+${ev['call']:.2f}[/green]"
+        else:
+            call_line = f"EV of Call: [red]${ev['call']:.2f}[/red]"
+        return f"{call_line}\nEV of Fold: ${ev['fold']:.2f}"
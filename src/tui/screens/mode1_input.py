@@ -1,12 +1,24 @@
 """Mode 1: Hand Evaluator & Spot Analyzer - Input Screen."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal
 from textual.widgets import Header, Footer, Button, Input, Static, Label
 from textual.binding import Binding
 
+if TYPE_CHECKING:
+    from .mode1_comprehensive import Mode1ComprehensiveScreen
+
+INPUT_IDS = ("hero_hand", "board", "pot_size", "bet_to_call", "effective_stack")
+
+# Optional numeric inputs: (input id / attribute name, label for errors)
+NUMERIC_FIELDS = (
+    ("pot_size", "Pot size"),
+    ("bet_to_call", "Bet to call"),
+    ("effective_stack", "Effective stack"),
+)
+
 
 class Mode1InputScreen(Screen):
     """Interactive input screen for hand evaluation and spot analysis."""
@@ -77,6 +89,9 @@ class Mode1InputScreen(Screen):
         Binding("ctrl+a", "analyze", "Analyze", show=True),
     ]
 
+    # Analysis screen class, imported lazily by action_analyze()
+    _analysis_screen_cls: Optional[Type["Mode1ComprehensiveScreen"]] = None
+
     def __init__(self) -> None:
         """Initialize the input screen."""
         super().__init__()
@@ -85,6 +100,7 @@ class Mode1InputScreen(Screen):
         self.pot_size: Optional[float] = None
         self.bet_to_call: Optional[float] = None
         self.effective_stack: Optional[float] = None
+        self._inputs: Dict[str, Input] = {}
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -149,6 +165,12 @@ class Mode1InputScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Cache references to the input widgets."""
+        self._inputs = {
+            input_id: self.query_one(f"#{input_id}", Input) for input_id in INPUT_IDS
+        }
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id
@@ -173,11 +195,15 @@ class Mode1InputScreen(Screen):
             self.notify("Error: Hero hand and board are required", severity="error")
             return
 
-        # Push to analysis screen
-        from .mode1_comprehensive import Mode1ComprehensiveScreen
+        # Push to analysis screen (class resolved once, on first analysis)
+        screen_cls = Mode1InputScreen._analysis_screen_cls
+        if screen_cls is None:
+            from .mode1_comprehensive import Mode1ComprehensiveScreen as screen_cls
+
+            Mode1InputScreen._analysis_screen_cls = screen_cls
 
         self.app.push_screen(
-            Mode1ComprehensiveScreen(
+            screen_cls(
                 hero_hand=self.hero_hand,
                 board=self.board,
                 pot_size=self.pot_size,
@@ -193,50 +219,41 @@ class Mode1InputScreen(Screen):
         Returns:
             True if inputs are valid, False otherwise
         """
-        try:
-            # Get text inputs
-            hero_input = self.query_one("#hero_hand", Input)
-            board_input = self.query_one("#board", Input)
-            pot_input = self.query_one("#pot_size", Input)
-            bet_input = self.query_one("#bet_to_call", Input)
-            stack_input = self.query_one("#effective_stack", Input)
-
-            self.hero_hand = hero_input.value.strip()
-            self.board = board_input.value.strip()
+        self.hero_hand = self._inputs["hero_hand"].value.strip()
+        self.board = self._inputs["board"].value.strip()
 
-            # Parse numeric inputs (optional)
+        # Parse numeric inputs (optional), reporting every bad field at once
+        values: Dict[str, Optional[float]] = {}
+        errors: List[str] = []
+        for input_id, label in NUMERIC_FIELDS:
             try:
-                pot_value = pot_input.value.strip()
-                self.pot_size = float(pot_value) if pot_value else None
-            except ValueError:
-                self.notify(
-                    f"Error: Pot size must be a number (got '{pot_input.value}')",
-                    severity="error",
-                )
-                return False
+                values[input_id] = self._parse_optional_float(input_id, label)
+            except ValueError as e:
+                errors.append(f"Error: {e}")
 
-            try:
-                bet_value = bet_input.value.strip()
-                self.bet_to_call = float(bet_value) if bet_value else None
-            except ValueError:
-                self.notify(
-                    f"Error: Bet to call must be a number (got '{bet_input.value}')",
-                    severity="error",
-                )
-                return False
+        if errors:
+            self.notify("\n".join(errors), severity="error")
+            return False
 
-            try:
-                stack_value = stack_input.value.strip()
-                self.effective_stack = float(stack_value) if stack_value else None
-            except ValueError:
-                self.notify(
-                    f"Error: Effective stack must be a number (got '{stack_input.value}')",
-                    severity="error",
-                )
-                return False
+        for input_id, value in values.items():
+            setattr(self, input_id, value)
+        return True
+
+    def _parse_optional_float(self, input_id: str, label: str) -> Optional[float]:
+        """
+        Parse an optional numeric input.
 
-            return True
+        Returns:
+            The parsed value, or None for an empty field
 
-        except Exception as e:
-            self.notify(f"Error collecting inputs: {str(e)}", severity="error")
-            return False
+        Raises:
+            ValueError: If the field is not a number
+        """
+        raw = self._inputs[input_id].value
+        value = raw.strip()
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"{label} must be a number (got '{raw}')") from None
@@ -1,13 +1,48 @@
 """Mode 2: Range Tools - Input Screen."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Type, cast
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal
 from textual.widgets import Header, Footer, Button, Input, Static, Label, Select
 from textual.binding import Binding
+from textual.timer import Timer
 
-from ...core.gto_charts import GTOCharts
+from ...core.gto_charts import get_charts
+
+if TYPE_CHECKING:
+    from .mode2_matrix import Mode2MatrixScreen
+
+# Seconds of typing inactivity before the custom range is parsed
+RANGE_CHECK_DELAY = 0.15
+
+# 9-handed positions as (chart key / label, button id suffix); "+" isn't
+# valid in a widget id, so UTG+1 uses "UTG-1"
+POSITIONS = (
+    ("UTG", "UTG"),
+    ("UTG+1", "UTG-1"),
+    ("MP", "MP"),
+    ("LJ", "LJ"),
+    ("HJ", "HJ"),
+    ("CO", "CO"),
+    ("BTN", "BTN"),
+    ("SB", "SB"),
+    ("BB", "BB"),
+)
+POSITION_BY_SUFFIX = {suffix: position for position, suffix in POSITIONS}
+
+# Buttons in the first (early/middle position) row
+POSITION_ROW_SPLIT = 5
+
+# Name the shared matrix screen is installed under, so it is built only once
+MATRIX_SCREEN_NAME = "mode2_matrix"
+
+# Dropdown labels for actions that don't read well title-cased
+ACTION_LABELS = {
+    "open": "Open/Raise",
+    "call_vs_BTN": "Call vs BTN Open",
+    "3bet_vs_BTN": "3-bet vs BTN Open",
+}
 
 
 class Mode2InputScreen(Screen):
@@ -114,16 +149,33 @@ class Mode2InputScreen(Screen):
         Binding("ctrl+v", "view_range", "View Range", show=True),
     ]
 
+    # Matrix screen class, imported lazily by _matrix_screen_cls()
+    _matrix_cls: Optional[Type["Mode2MatrixScreen"]] = None
+
     def __init__(self) -> None:
         """Initialize the input screen."""
         super().__init__()
-        self.charts = GTOCharts()
+        self.charts = get_charts()
         self.selected_position: Optional[str] = None
         self.selected_action: Optional[str] = None
         self.custom_range: str = ""
+        self._selected_btn: Optional[Button] = None
+        # Position buttons keyed by position, filled in by compose
+        self._pos_buttons: Dict[str, Button] = {}
+        self._range_check_timer: Optional[Timer] = None
+        # Widget references, cached in on_mount
+        self._custom_input: Input
+        self._action_select: Select
+
+    def _position_button(self, position: str, suffix: str) -> Button:
+        """Create a position button and remember it for selection updates."""
+        button = Button(position, id=f"pos_{suffix}", classes="position_btn")
+        self._pos_buttons[position] = button
+        return button
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
+        self._pos_buttons = {}
         yield Header()
 
         with Container(id="input_container"):
@@ -133,20 +185,12 @@ class Mode2InputScreen(Screen):
             # Position selection
             yield Static("Select Position:", classes="section_title")
 
-            # Row 1: Early/Middle positions
-            with Horizontal(classes="position_row"):
-                yield Button("UTG", id="pos_UTG", classes="position_btn")
-                yield Button("UTG+1", id="pos_UTG-1", classes="position_btn")
-                yield Button("MP", id="pos_MP", classes="position_btn")
-                yield Button("LJ", id="pos_LJ", classes="position_btn")
-                yield Button("HJ", id="pos_HJ", classes="position_btn")
-
-            # Row 2: Late positions
-            with Horizontal(classes="position_row"):
-                yield Button("CO", id="pos_CO", classes="position_btn")
-                yield Button("BTN", id="pos_BTN", classes="position_btn")
-                yield Button("SB", id="pos_SB", classes="position_btn")
-                yield Button("BB", id="pos_BB", classes="position_btn")
+            # Row 1: Early/Middle positions, Row 2: Late positions
+            split = POSITION_ROW_SPLIT
+            for row in (POSITIONS[:split], POSITIONS[split:]):
+                with Horizontal(classes="position_row"):
+                    for position, suffix in row:
+                        yield self._position_button(position, suffix)
 
             # Action selection
             with Horizontal(classes="input_group"):
@@ -180,6 +224,11 @@ class Mode2InputScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Cache references to the widgets used on every interaction."""
+        self._custom_input = self.query_one("#custom_range", Input)
+        self._action_select = self.query_one("#action_select", Select)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id or ""
@@ -189,49 +238,91 @@ class Mode2InputScreen(Screen):
         elif button_id == "view_range":
             self.action_view_range()
         elif button_id.startswith("pos_"):
-            self._select_position(button_id[4:])
+            self._select_position(POSITION_BY_SUFFIX[button_id[4:]])
 
     def _select_position(self, position: str) -> None:
         """Handle position button selection."""
-        # Update visual state - remove selected from all, add to clicked
-        for btn in self.query(".position_btn"):
-            btn.remove_class("selected")
+        # Update visual state - move the highlight to the clicked button
+        if self._selected_btn is not None:
+            self._selected_btn.remove_class("selected")
 
-        clicked_btn = self.query_one(f"#pos_{position}", Button)
+        clicked_btn = self._pos_buttons[position]
         clicked_btn.add_class("selected")
-
-        # Map button ID back to data key (UTG-1 -> UTG+1)
-        self.selected_position = position.replace("-1", "+1")
+        self._selected_btn = clicked_btn
+        self.selected_position = position
 
         # Update action dropdown
         actions = self.charts.get_actions(self.selected_position)
-        select = self.query_one("#action_select", Select)
+        select = self._action_select
 
         if actions:
             # Format action names for display
-            formatted_actions = []
-            for action in actions:
-                if action == "open":
-                    formatted_actions.append(("Open/Raise", action))
-                elif action == "call_vs_BTN":
-                    formatted_actions.append(("Call vs BTN Open", action))
-                elif action == "3bet_vs_BTN":
-                    formatted_actions.append(("3-bet vs BTN Open", action))
-                else:
-                    formatted_actions.append((action.replace("_", " ").title(), action))
-
-            select.set_options(formatted_actions)
-            select.value = actions[0]
+            formatted_actions = [
+                (ACTION_LABELS.get(action) or action.replace("_", " ").title(), action)
+                for action in actions
+            ]
+
+            # Swap options and value in one repaint
+            with self.app.batch_update():
+                select.set_options(formatted_actions)
+                select.value = actions[0]
             self.selected_action = actions[0]
         else:
-            select.set_options([("No actions available", "")])
-            select.value = ""
+            with self.app.batch_update():
+                select.set_options([("No actions available", "")])
+                select.value = ""
             self.selected_action = None
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle action selection change."""
         if event.select.id == "action_select":
-            self.selected_action = str(event.value) if event.value else None
+            action = str(event.value) if event.value else None
+            if action != self.selected_action:
+                self.selected_action = action
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Validate the custom range once typing pauses."""
+        if event.input.id != "custom_range":
+            return
+        if self._range_check_timer is not None:
+            self._range_check_timer.stop()
+        self._range_check_timer = self.set_timer(
+            RANGE_CHECK_DELAY, self._check_custom_range
+        )
+
+    def _check_custom_range(self) -> None:
+        """Parse the custom range (warming the cache) and flag invalid input."""
+        self._range_check_timer = None
+        custom_input = self._custom_input
+        notation = custom_input.value.strip()
+        try:
+            if notation:
+                self._matrix_screen_cls().validate_custom_range(notation)
+        except ValueError:
+            custom_input.add_class("-invalid")
+        else:
+            custom_input.remove_class("-invalid")
+
+    @classmethod
+    def _matrix_screen_cls(cls) -> Type["Mode2MatrixScreen"]:
+        """Import the matrix screen class on first use and keep a reference."""
+        if cls._matrix_cls is None:
+            from .mode2_matrix import Mode2MatrixScreen
+
+            cls._matrix_cls = Mode2MatrixScreen
+        return cls._matrix_cls
+
+    def _show_matrix(self, **range_args: Optional[str]) -> None:
+        """Push the matrix screen, reusing the installed instance if there is one."""
+        app = self.app
+        if app.is_screen_installed(MATRIX_SCREEN_NAME):
+            # Only _show_matrix installs a screen under this name
+            screen = cast("Mode2MatrixScreen", app.get_screen(MATRIX_SCREEN_NAME))
+            screen.load(**range_args)
+        else:
+            screen = self._matrix_screen_cls()(**range_args)
+            app.install_screen(screen, MATRIX_SCREEN_NAME)
+        app.push_screen(screen)
 
     def action_back(self) -> None:
         """Return to main menu."""
@@ -240,27 +331,22 @@ class Mode2InputScreen(Screen):
     def action_view_range(self) -> None:
         """View the selected or custom range."""
         # Check for custom range first
-        custom_input = self.query_one("#custom_range", Input)
+        custom_input = self._custom_input
         self.custom_range = custom_input.value.strip()
 
         if self.custom_range:
             # Use custom range
-            from .mode2_matrix import Mode2MatrixScreen
+            try:
+                self._matrix_screen_cls().validate_custom_range(self.custom_range)
+            except ValueError as e:
+                self.notify(f"Invalid range: {e}", severity="error")
+                return
 
-            self.app.push_screen(
-                Mode2MatrixScreen(
-                    custom_range=self.custom_range,
-                )
-            )
+            self._show_matrix(custom_range=self.custom_range)
         elif self.selected_position and self.selected_action:
             # Use GTO range
-            from .mode2_matrix import Mode2MatrixScreen
-
-            self.app.push_screen(
-                Mode2MatrixScreen(
-                    position=self.selected_position,
-                    action=self.selected_action,
-                )
+            self._show_matrix(
+                position=self.selected_position, action=self.selected_action
             )
         else:
             self.notify(
@@ -1,13 +1,98 @@
 """Mode 2: Range Tools - Matrix Display Screen."""
 
-from typing import Optional, List
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
 from textual.app import ComposeResult
 from textual.screen import Screen
-from textual.containers import Container, Horizontal, VerticalScroll
+from textual.containers import Container, VerticalScroll
 from textual.widgets import Header, Footer, Button, Static
 from textual.binding import Binding
 
-from ...core.gto_charts import GTOCharts, RANKS
+from ...core.gto_charts import RANKS, get_charts, matrix_hand
+
+# Title labels for actions that don't read well title-cased
+ACTION_TITLES = {
+    "open": "Open Range",
+    "call_vs_BTN": "Call vs BTN",
+    "3bet_vs_BTN": "3-bet vs BTN",
+}
+
+_HEADER_ROW = "    " + "".join(f" {r}  " for r in RANKS)
+
+# Cell types, as stored in _CELL_META
+_PAIR, _SUITED, _OFFSUIT = range(3)
+
+# Markup style per cell, indexed by cell_type * 2 + in_range
+_CELL_STYLES = (
+    "#aa8888 on #442222",  # pair
+    "bold black on #ff4444",
+    "#88aa88 on #224422",  # suited
+    "bold black on #44dd44",
+    "#8888aa on #222244",  # offsuit
+    "bold black on #4488ff",
+)
+
+# Cell colour key shown under the matrix
+_LEGEND = "[on red] PP [/] Pairs    [on green] s [/] Suited    [on blue] o [/] Offsuit"
+
+
+def _build_cell_meta() -> Tuple[Tuple[int, str], ...]:
+    """(cell_type, hand) for all 169 cells, indexed by row * 13 + col."""
+    meta = []
+    for row in range(13):
+        for col in range(13):
+            # Pairs on the diagonal, suited above it, offsuit below
+            if row == col:
+                cell_type = _PAIR
+            elif row < col:
+                cell_type = _SUITED
+            else:
+                cell_type = _OFFSUIT
+            meta.append((cell_type, matrix_hand(row, col)))
+    return tuple(meta)
+
+
+_CELL_META = _build_cell_meta()
+
+
+class _RangeView(NamedTuple):
+    """Immutable, display-ready range data shared between screen instances."""
+
+    hands: Tuple[str, ...]
+    notation: str
+    total_combos: int
+    percentage: float
+    matrix: int  # 169-bit mask, bit row*13+col set when the hand is in range
+
+
+def _build_view(hands: List[str], notation: str, combos: int, pct: float) -> _RangeView:
+    """Freeze range data and its packed 13x13 matrix for caching."""
+    mask = get_charts().hands_to_bitmask(hands)
+    return _RangeView(tuple(hands), notation, combos, pct, mask)
+
+
+@lru_cache(maxsize=256)
+def _resolve_gto(position: str, action: str) -> _RangeView:
+    """Resolve a GTO chart range (cached per position/action)."""
+    range_data = get_charts().get_range(position, action) or {}
+    return _build_view(
+        range_data.get("hands", []),
+        range_data.get("notation", ""),
+        range_data.get("total_combos", 0),
+        range_data.get("percentage", 0.0),
+    )
+
+
+@lru_cache(maxsize=256)
+def _resolve_custom(range_str: str) -> _RangeView:
+    """Resolve a custom range notation string (cached per string)."""
+    result = get_charts().parse_custom_range(range_str)
+    return _build_view(
+        result.get("hands", []),
+        range_str,
+        result.get("total_combos", 0),
+        result.get("percentage", 0.0),
+    )
 
 
 class Mode2MatrixScreen(Screen):
@@ -52,55 +137,6 @@ class Mode2MatrixScreen(Screen):
         align: center middle;
     }
 
-    .cell {
-        width: 4;
-        height: 1;
-        text-align: center;
-        content-align: center middle;
-    }
-
-    .header_cell {
-        width: 4;
-        height: 1;
-        text-align: center;
-        content-align: center middle;
-        color: $accent;
-        text-style: bold;
-    }
-
-    .pair {
-        background: #442222;
-        color: #aa8888;
-    }
-
-    .pair.in_range {
-        background: #ff4444;
-        color: black;
-        text-style: bold;
-    }
-
-    .suited {
-        background: #224422;
-        color: #88aa88;
-    }
-
-    .suited.in_range {
-        background: #44dd44;
-        color: black;
-        text-style: bold;
-    }
-
-    .offsuit {
-        background: #222244;
-        color: #8888aa;
-    }
-
-    .offsuit.in_range {
-        background: #4488ff;
-        color: black;
-        text-style: bold;
-    }
-
     .summary {
         width: 100%;
         height: auto;
@@ -109,21 +145,11 @@ class Mode2MatrixScreen(Screen):
         border: solid $primary;
     }
 
-    .summary_line {
-        width: 100%;
-        padding: 0;
-    }
-
     .legend {
         width: 100%;
         height: auto;
         padding: 1 0;
-        align: center middle;
-    }
-
-    .legend_item {
-        width: auto;
-        padding: 0 2;
+        text-align: center;
     }
 
     .buttons {
@@ -160,40 +186,65 @@ class Mode2MatrixScreen(Screen):
         self.position = position
         self.action = action
         self.custom_range = custom_range
-        self.charts = GTOCharts()
 
-        # Load range data
+        # Range data, loaded by compose once the screen is actually mounted
         self.hands: List[str] = []
         self.notation: str = ""
         self.total_combos: int = 0
         self.percentage: float = 0.0
-        self.matrix: List[List[bool]] = [[False] * 13 for _ in range(13)]
+        self.matrix: int = 0
 
-        self._load_range()
+    @staticmethod
+    def validate_custom_range(range_str: str) -> None:
+        """
+        Check a custom range notation, caching the parsed range for display.
+
+        Args:
+            range_str: Custom range notation string
+
+        Raises:
+            ValueError: If the notation can't be parsed
+        """
+        _resolve_custom(range_str)
+
+    def load(
+        self,
+        position: Optional[str] = None,
+        action: Optional[str] = None,
+        custom_range: Optional[str] = None,
+    ) -> None:
+        """
+        Point the screen at a different range, rebuilding it if already shown.
+
+        Args:
+            position: GTO position (e.g., "BTN")
+            action: GTO action (e.g., "open")
+            custom_range: Custom range notation string
+        """
+        self.position = position
+        self.action = action
+        self.custom_range = custom_range
+        if self.is_mounted:
+            self.refresh(recompose=True)
 
     def _load_range(self) -> None:
         """Load the range data."""
         if self.custom_range:
-            # Parse custom range
-            result = self.charts.parse_custom_range(self.custom_range)
-            self.hands = result.get("hands", [])
-            self.notation = self.custom_range
-            self.total_combos = result.get("total_combos", 0)
-            self.percentage = result.get("percentage", 0.0)
+            view = _resolve_custom(self.custom_range.strip())
         elif self.position and self.action:
-            # Load GTO range
-            range_data = self.charts.get_range(self.position, self.action)
-            if range_data:
-                self.hands = range_data.get("hands", [])
-                self.notation = range_data.get("notation", "")
-                self.total_combos = range_data.get("total_combos", 0)
-                self.percentage = range_data.get("percentage", 0.0)
+            view = _resolve_gto(self.position, self.action)
+        else:
+            return
 
-        # Convert to matrix
-        self.matrix = self.charts.hands_to_matrix(self.hands)
+        self.hands = list(view.hands)
+        self.notation = view.notation
+        self.total_combos = view.total_combos
+        self.percentage = view.percentage
+        self.matrix = view.matrix
 
     def compose(self) -> ComposeResult:
         """Create widgets."""
+        self._load_range()
         yield Header()
 
         with VerticalScroll():
@@ -213,35 +264,23 @@ class Mode2MatrixScreen(Screen):
             # Matrix container
             with Container(id="matrix_container"):
                 # Header row with rank labels
-                header_cells = "    " + "".join(f" {r}  " for r in RANKS)
-                yield Static(header_cells, classes="matrix_row")
+                yield Static(_HEADER_ROW, classes="matrix_row")
 
                 # Matrix rows
                 for row in range(13):
-                    row_widgets = self._create_matrix_row(row)
-                    with Horizontal(classes="matrix_row"):
-                        for widget in row_widgets:
-                            yield widget
+                    yield Static(self._create_matrix_row(row), classes="matrix_row")
 
             # Legend
-            with Horizontal(classes="legend"):
-                yield Static("[on red] PP [/] Pairs", classes="legend_item")
-                yield Static("[on green] s [/] Suited", classes="legend_item")
-                yield Static("[on blue] o [/] Offsuit", classes="legend_item")
+            yield Static(_LEGEND, classes="legend")
 
             # Summary section
-            with Container(classes="summary"):
-                yield Static(
-                    f"[bold]Notation:[/bold] {self.notation}", classes="summary_line"
-                )
-                yield Static(
-                    f"[bold]Hands in range:[/bold] {len(self.hands)} unique hands",
-                    classes="summary_line",
-                )
-                yield Static(
-                    f"[bold]Total combos:[/bold] {self.total_combos} / 1326 ({self.percentage}%)",
-                    classes="summary_line",
-                )
+            yield Static(
+                f"[bold]Notation:[/bold] {self.notation}\n"
+                f"[bold]Hands in range:[/bold] {len(self.hands)} unique hands\n"
+                f"[bold]Total combos:[/bold] {self.total_combos} / 1326 "
+                f"({self.percentage}%)",
+                classes="summary",
+            )
 
             # Buttons
             with Container(classes="buttons"):
@@ -250,50 +289,26 @@ class Mode2MatrixScreen(Screen):
 
         yield Footer()
 
-    def _create_matrix_row(self, row: int) -> List[Static]:
-        """Create widgets for a matrix row."""
-        widgets = []
+    def _create_matrix_row(self, row: int) -> str:
+        """Build the markup for one matrix row (label plus 13 cells)."""
+        parts = [f"[bold cyan]{RANKS[row]:^4}[/]"]
 
-        # Row label
-        widgets.append(Static(f" {RANKS[row]} ", classes="header_cell"))
-
-        # Cells
+        base = row * 13
         for col in range(13):
-            hand = self.charts.get_matrix_hand(row, col)
-            in_range = self.matrix[row][col]
+            cell_type, display = _CELL_META[base + col]
+            in_range = (self.matrix >> (base + col)) & 1
+            style = _CELL_STYLES[cell_type * 2 + in_range]
+            parts.append(f"[{style}]{display:^4}[/]")
 
-            # Determine cell type
-            if row == col:
-                cell_type = "pair"
-            elif row < col:
-                cell_type = "suited"
-            else:
-                cell_type = "offsuit"
-
-            # Create cell with appropriate styling
-            classes = f"cell {cell_type}"
-            if in_range:
-                classes += " in_range"
-
-            # Display hand name (shortened for offsuit)
-            display = hand[:2] if len(hand) == 2 else hand
-            widgets.append(Static(display, classes=classes))
-
-        return widgets
+        return "".join(parts)
 
     def _format_action(self) -> str:
         """Format action name for display."""
         if not self.action:
             return ""
 
-        if self.action == "open":
-            return "Open Range"
-        elif self.action == "call_vs_BTN":
-            return "Call vs BTN"
-        elif self.action == "3bet_vs_BTN":
-            return "3-bet vs BTN"
-        else:
-            return self.action.replace("_", " ").title()
+        label = ACTION_TITLES.get(self.action)
+        return label or self.action.replace("_", " ").title()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -1,153 +1,185 @@
 """Mode 3: Quiz System - Quiz Screen."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.widgets import Header, Footer, Button, Static, ProgressBar
 from textual.binding import Binding
+from textual.timer import Timer
 
 from ...quiz import QuizEngine, format_options, format_question_display
 from ...database.service import save_quiz_session
 from .mode3_results import Mode3ResultsScreen
 
+# Answer option letters, matching the opt_<letter> button ids
+OPTION_LABELS = ("A", "B", "C", "D")
+_OPTION_INDEX = {f"opt_{label}": i for i, label in enumerate(OPTION_LABELS)}
+
+# Seconds to wait before drawing a new question, so bursts of key presses
+# (answer, next, answer, ...) redraw once
+RENDER_DELAY = 0.033
+
+# Stylesheet, parsed once by Textual and shared by every instance
+_QUIZ_CSS = """
+Mode3QuizScreen {
+    align: center middle;
+}
+
+#quiz_container {
+    width: 80;
+    height: 85%;
+    border: solid $primary;
+    background: $surface;
+    padding: 2;
+}
+
+#quiz_scroll {
+    height: 1fr;
+}
+
+#header_row {
+    height: auto;
+    width: 100%;
+    margin-bottom: 1;
+}
+
+#progress_text {
+    width: 1fr;
+    text-align: left;
+    color: $accent;
+}
+
+#score_text {
+    width: 1fr;
+    text-align: right;
+    color: $success;
+}
+
+#progress_container {
+    width: 100%;
+    height: auto;
+    align: center middle;
+    margin-bottom: 1;
+}
+
+#progress_bar {
+    width: 50%;
+}
+
+#question_area {
+    width: 100%;
+    height: auto;
+    min-height: 8;
+    padding: 1;
+    margin-bottom: 1;
+    border: solid $primary;
+    background: $surface-darken-1;
+}
+
+#question_text {
+    width: 100%;
+}
+
+#options_area {
+    width: 100%;
+    height: auto;
+}
+
+.option_btn {
+    width: 100%;
+    margin: 0 0 1 0;
+}
+
+.option_btn.correct {
+    background: $success;
+}
+
+.option_btn.incorrect {
+    background: $error;
+}
+
+.option_btn.revealed {
+    background: $success-darken-2;
+}
+
+#feedback_area {
+    width: 100%;
+    height: auto;
+    padding: 1;
+    margin-top: 1;
+    border: solid $primary;
+    display: none;
+}
+
+#feedback_area.show {
+    display: block;
+}
+
+#feedback_result {
+    text-align: center;
+    text-style: bold;
+    margin-bottom: 1;
+}
+
+#feedback_result.correct {
+    color: $success;
+}
+
+#feedback_result.incorrect {
+    color: $error;
+}
+
+#explanation_text {
+    color: $text;
+}
+
+#nav_row {
+    margin-top: 1;
+    height: 3;
+    align: center middle;
+}
+
+#nav_row Button {
+    margin: 0 1;
+    width: 20;
+    text-align: center;
+}
+
+#next_btn {
+    display: none;
+}
+
+#next_btn.show {
+    display: block;
+}
+"""
+
+
+# Display text and formatted options per question id, filled by _question_strings
+_QUESTION_STRINGS: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+
+
+def _question_strings(question: Dict[str, Any]) -> Tuple[str, Tuple[str, ...]]:
+    """Display text and formatted options for a question, cached by question id."""
+    question_id = question.get("id")
+    cached = _QUESTION_STRINGS.get(question_id) if question_id else None
+    if cached is not None:
+        return cached
+    strings = (
+        format_question_display(question),
+        tuple(format_options(question.get("options", []))),
+    )
+    if question_id:
+        _QUESTION_STRINGS[question_id] = strings
+    return strings
+
 
 class Mode3QuizScreen(Screen):
     """Quiz screen for displaying and answering questions."""
 
-    CSS = """
-    Mode3QuizScreen {
-        align: center middle;
-    }
-
-    #quiz_container {
-        width: 80;
-        height: 85%;
-        border: solid $primary;
-        background: $surface;
-        padding: 2;
-    }
-
-    #quiz_scroll {
-        height: 1fr;
-    }
-
-    #header_row {
-        height: auto;
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    #progress_text {
-        width: 1fr;
-        text-align: left;
-        color: $accent;
-    }
-
-    #score_text {
-        width: 1fr;
-        text-align: right;
-        color: $success;
-    }
-
-    #progress_container {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin-bottom: 1;
-    }
-
-    #progress_bar {
-        width: 50%;
-    }
-
-    #question_area {
-        width: 100%;
-        height: auto;
-        min-height: 8;
-        padding: 1;
-        margin-bottom: 1;
-        border: solid $primary;
-        background: $surface-darken-1;
-    }
-
-    #question_text {
-        width: 100%;
-    }
-
-    #options_area {
-        width: 100%;
-        height: auto;
-    }
-
-    .option_btn {
-        width: 100%;
-        margin: 0 0 1 0;
-    }
-
-    .option_btn.correct {
-        background: $success;
-    }
-
-    .option_btn.incorrect {
-        background: $error;
-    }
-
-    .option_btn.revealed {
-        background: $success-darken-2;
-    }
-
-    #feedback_area {
-        width: 100%;
-        height: auto;
-        padding: 1;
-        margin-top: 1;
-        border: solid $primary;
-        display: none;
-    }
-
-    #feedback_area.show {
-        display: block;
-    }
-
-    #feedback_result {
-        text-align: center;
-        text-style: bold;
-        margin-bottom: 1;
-    }
-
-    #feedback_result.correct {
-        color: $success;
-    }
-
-    #feedback_result.incorrect {
-        color: $error;
-    }
-
-    #explanation_text {
-        color: $text;
-    }
-
-    #nav_row {
-        margin-top: 1;
-        height: 3;
-        align: center middle;
-    }
-
-    #nav_row Button {
-        margin: 0 1;
-        width: 20;
-        text-align: center;
-    }
-
-    #next_btn {
-        display: none;
-    }
-
-    #next_btn.show {
-        display: block;
-    }
-    """
+    CSS = _QUIZ_CSS
 
     BINDINGS = [
         Binding("escape", "quit_quiz", "Quit Quiz", show=True),
@@ -180,6 +212,26 @@ class Mode3QuizScreen(Screen):
         self.current_question: Optional[Dict[str, Any]] = None
         self.answered = False
         self.feedback_result: Optional[Dict[str, Any]] = None
+        # True once answer feedback has marked option buttons with classes
+        self._opts_dirty = False
+        self._pending_render: Optional[Timer] = None
+        # Set once the session has been written to the database
+        self._saved = False
+        # Whole percent last shown on the progress bar
+        self._last_pct = -1
+        # (question, display text, formatted options) for the upcoming question,
+        # prepared by _prefetch_next while the user reads the feedback
+        self._prefetched: Optional[Tuple[Dict[str, Any], str, Tuple[str, ...]]] = None
+        # Widget references, cached in on_mount
+        self._opt_buttons: List[Button] = []
+        self._progress_text: Static
+        self._score_text: Static
+        self._progress_bar: ProgressBar
+        self._question_text: Static
+        self._feedback: Container
+        self._result_text: Static
+        self._explanation: Static
+        self._next_btn: Button
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -222,6 +274,18 @@ class Mode3QuizScreen(Screen):
 
     def on_mount(self) -> None:
         """Initialize quiz when screen is mounted."""
+        self._opt_buttons = [
+            self.query_one(f"#opt_{label}", Button) for label in OPTION_LABELS
+        ]
+        self._progress_text = self.query_one("#progress_text", Static)
+        self._score_text = self.query_one("#score_text", Static)
+        self._progress_bar = self.query_one("#progress_bar", ProgressBar)
+        self._question_text = self.query_one("#question_text", Static)
+        self._feedback = self.query_one("#feedback_area", Container)
+        self._result_text = self.query_one("#feedback_result", Static)
+        self._explanation = self.query_one("#explanation_text", Static)
+        self._next_btn = self.query_one("#next_btn", Button)
+
         # Load questions
         self.engine.load_questions(
             topic=self.topic,
@@ -241,81 +305,123 @@ class Mode3QuizScreen(Screen):
             self._show_results()
             return
 
+        # Coalesce quick key presses into a single redraw
+        if self._pending_render is not None:
+            self._pending_render.stop()
+        self._pending_render = self.set_timer(RENDER_DELAY, self._flush_render)
+
+    def _flush_render(self) -> None:
+        """Draw the current question now, cancelling any scheduled redraw."""
+        if self._pending_render is not None:
+            self._pending_render.stop()
+            self._pending_render = None
+        if self.current_question:
+            # Reconfigure every widget in one repaint
+            with self.app.batch_update():
+                self._render_question(self.current_question)
+
+    def _render_question(self, question: Dict[str, Any]) -> None:
+        """Update the progress, question and option widgets for a new question."""
         # Update progress
         progress = self.engine.get_progress()
-        progress_text = self.query_one("#progress_text", Static)
-        progress_text.update(f"Question {progress['current']}/{progress['total']}")
-
-        score_text = self.query_one("#score_text", Static)
-        score_text.update(f"Score: {progress['correct']}/{progress['answered']}")
-
-        # Update progress bar (based on questions answered)
-        progress_bar = self.query_one("#progress_bar", ProgressBar)
-        pct = progress["answered"] / progress["total"] * 100
-        progress_bar.progress = pct
-
-        # Display question
-        question_display = format_question_display(self.current_question)
-        question_text = self.query_one("#question_text", Static)
-        question_text.update(question_display)
-
-        # Display options
-        options = self.current_question.get("options", [])
-        formatted = format_options(options)
-        labels = ["A", "B", "C", "D"]
-
-        for i, label in enumerate(labels):
-            btn = self.query_one(f"#opt_{label}", Button)
+        self._progress_text.update(
+            f"Question {progress['current']}/{progress['total']}"
+        )
+        self._score_text.update(f"Score: {progress['correct']}/{progress['answered']}")
+
+        # Update progress bar (based on questions answered) when it moves
+        pct = progress["answered"] * 100 // progress["total"]
+        if pct != self._last_pct:
+            self._progress_bar.progress = pct
+            self._last_pct = pct
+
+        # Display question (using the prefetched text when it is for this one)
+        prefetched = self._prefetched
+        if prefetched is not None and prefetched[0] is question:
+            _, question_display, formatted = prefetched
+        else:
+            question_display, formatted = _question_strings(question)
+        self._prefetched = None
+        self._question_text.update(question_display)
+
+        # Display options (clearing last answer's marks only if there were any)
+        clear_marks = self._opts_dirty
+        self._opts_dirty = False
+        for i, btn in enumerate(self._opt_buttons):
+            if clear_marks:
+                btn.remove_class("correct", "incorrect", "revealed")
             if i < len(formatted):
                 btn.label = formatted[i]
                 btn.display = True
-                btn.remove_class("correct", "incorrect", "revealed")
                 btn.disabled = False
             else:
                 btn.display = False
 
         # Hide feedback
-        feedback = self.query_one("#feedback_area", Container)
-        feedback.remove_class("show")
+        self._feedback.remove_class("show")
 
         # Hide next button
-        next_btn = self.query_one("#next_btn", Button)
-        next_btn.remove_class("show")
+        self._next_btn.remove_class("show")
 
     def _submit_answer(self, answer: str) -> None:
         """Submit an answer."""
         if self.answered or not self.current_question:
             return
 
+        # Make sure the question being answered is on screen first
+        if self._pending_render is not None:
+            self._flush_render()
+
         self.answered = True
         self.feedback_result = self.engine.submit_answer(answer)
 
+        # Apply all feedback mutations in one repaint
+        with self.app.batch_update():
+            self._render_feedback(self.current_question, answer, self.feedback_result)
+
+        # Format the next question while the user reads the explanation
+        upcoming = self.engine.peek_next()
+        if upcoming is not None:
+            self._prefetch_next(upcoming)
+
+    @work(thread=True, exclusive=True, group="prefetch")
+    def _prefetch_next(self, question: Dict[str, Any]) -> None:
+        """Format the upcoming question off the UI thread."""
+        display, formatted = _question_strings(question)
+        self.app.call_from_thread(self._store_prefetch, question, display, formatted)
+
+    def _store_prefetch(
+        self, question: Dict[str, Any], display: str, formatted: Tuple[str, ...]
+    ) -> None:
+        """Keep the prefetched text for _render_question to pick up."""
+        self._prefetched = (question, display, formatted)
+
+    def _render_feedback(
+        self, question: Dict[str, Any], answer: str, feedback: Dict[str, Any]
+    ) -> None:
+        """Mark the chosen/correct options and show the answer feedback."""
         # Update button styles
-        options = self.current_question.get("options", [])
-        correct_answer = self.current_question.get("answer", "")
-        labels = ["A", "B", "C", "D"]
+        options = question.get("options", [])
+        correct_answer = question.get("answer", "")
 
-        for i, label in enumerate(labels):
-            if i >= len(options):
-                break
-            btn = self.query_one(f"#opt_{label}", Button)
+        for btn, option in zip(self._opt_buttons, options):
             btn.disabled = True
 
-            if options[i] == answer:
-                if self.feedback_result["is_correct"]:
+            if option == answer:
+                if feedback["is_correct"]:
                     btn.add_class("correct")
                 else:
                     btn.add_class("incorrect")
 
-            if options[i] == correct_answer and not self.feedback_result["is_correct"]:
+            if option == correct_answer and not feedback["is_correct"]:
                 btn.add_class("revealed")
+        self._opts_dirty = True
 
         # Show feedback
-        feedback = self.query_one("#feedback_area", Container)
-        feedback.add_class("show")
+        self._feedback.add_class("show")
 
-        result_text = self.query_one("#feedback_result", Static)
-        if self.feedback_result["is_correct"]:
+        result_text = self._result_text
+        if feedback["is_correct"]:
             result_text.update("[bold green]Correct![/bold green]")
             result_text.add_class("correct")
             result_text.remove_class("incorrect")
@@ -326,23 +432,20 @@ class Mode3QuizScreen(Screen):
             result_text.add_class("incorrect")
             result_text.remove_class("correct")
 
-        explanation = self.query_one("#explanation_text", Static)
-        explanation.update(self.feedback_result.get("explanation", ""))
+        self._explanation.update(feedback.get("explanation", ""))
 
         # Show next button (change label on last question)
-        next_btn = self.query_one("#next_btn", Button)
+        next_btn = self._next_btn
         progress = self.engine.get_progress()
         if progress["answered"] >= progress["total"]:
             next_btn.label = "View Results"
         else:
             next_btn.label = "Next Question"
-        next_btn.remove_class("show")
-        next_btn.add_class("show")
+        if "show" not in next_btn.classes:
+            next_btn.add_class("show")
 
         # Update score display
-        progress = self.engine.get_progress()
-        score_text = self.query_one("#score_text", Static)
-        score_text.update(f"Score: {progress['correct']}/{progress['answered']}")
+        self._score_text.update(f"Score: {progress['correct']}/{progress['answered']}")
 
     def _next_question(self) -> None:
         """Move to next question."""
@@ -359,17 +462,7 @@ class Mode3QuizScreen(Screen):
     def _show_results(self) -> None:
         """Show quiz results screen and save to database."""
         results = self.engine.get_results()
-
-        # Save session (also saves individual attempts internally)
-        try:
-            save_quiz_session(
-                results=results,
-                topic=self.topic,
-                difficulty=self.difficulty,
-            )
-        except Exception:
-            pass  # Continue to show results even if save fails
-
+        self._save_once(results)
         self.app.switch_screen(Mode3ResultsScreen(results=results))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -380,18 +473,8 @@ class Mode3QuizScreen(Screen):
             self.action_quit_quiz()
         elif button_id == "next_btn":
             self._next_question()
-        elif button_id.startswith("opt_"):
-            label = button_id[4:]  # Extract A, B, C, D
-            options = (
-                self.current_question.get("options", [])
-                if self.current_question
-                else []
-            )
-            labels = ["A", "B", "C", "D"]
-            if label in labels:
-                idx = labels.index(label)
-                if idx < len(options):
-                    self._submit_answer(options[idx])
+        elif button_id in _OPTION_INDEX:
+            self._select_option(_OPTION_INDEX[button_id])
 
     def action_select_a(self) -> None:
         """Select option A."""
@@ -426,14 +509,22 @@ class Mode3QuizScreen(Screen):
         """Quit quiz and return to setup, saving any progress."""
         results = self.engine.get_results()
         if results.get("answers"):
-            # Save session (also saves individual attempts internally)
-            try:
-                save_quiz_session(
-                    results=results,
-                    topic=self.topic,
-                    difficulty=self.difficulty,
-                )
-            except Exception:
-                pass
+            self._save_once(results)
 
         self.app.pop_screen()
+
+    def _save_once(self, results: Dict[str, Any]) -> None:
+        """Save the quiz session, at most once per quiz."""
+        if self._saved:
+            return
+        self._saved = True
+
+        # Save session (also saves individual attempts internally)
+        try:
+            save_quiz_session(
+                results=results,
+                topic=self.topic,
+                difficulty=self.difficulty,
+            )
+        except Exception:
+            pass  # Continue to show results even if save fails
@@ -1,96 +1,158 @@
 """Mode 3: Quiz System - Results Screen."""
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+from rich.table import Table
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.widgets import Header, Footer, Button, Static
 from textual.binding import Binding
 
+from ...quiz import DIFFICULTIES, format_topic_name
+
+# Incorrect-answer items mounted up front and per scroll step
+INCORRECT_BATCH = 10
+
+# Markup for one reviewed incorrect answer
+_INCORRECT_ITEM = (
+    "[bold]{num}. {question}[/bold]\n"
+    "   Your answer: [red]{your_answer}[/red]\n"
+    "   Correct: [green]{correct_answer}[/green]\n"
+)
+
+# Score display per grade as (minimum percentage, CSS class, markup template),
+# best grade first
+_SCORE_TEMPLATES = (
+    (80, "excellent", "[bold green]{s}/{t}[/bold green] ({p:.1f}%)\nExcellent!"),
+    (60, "good", "[bold yellow]{s}/{t}[/bold yellow] ({p:.1f}%)\nGood job!"),
+    (0, "needs_work", "[bold red]{s}/{t}[/bold red] ({p:.1f}%)\nKeep practicing!"),
+)
+
+# Sort position of each difficulty level (unknown levels sort last)
+_DIFF_RANK = {name: i for i, name in enumerate(DIFFICULTIES)}
+
+# Stylesheet, parsed once by Textual and shared by every instance
+_RESULTS_CSS = """
+Mode3ResultsScreen {
+    align: center middle;
+}
+
+#results_container {
+    width: 80;
+    height: 85%;
+    border: solid $primary;
+    background: $surface;
+    padding: 2;
+}
+
+#header_section {
+    height: auto;
+    width: 100%;
+}
+
+#title {
+    text-align: center;
+    width: 100%;
+    padding: 1;
+    color: $accent;
+    text-style: bold;
+}
+
+#score_big {
+    text-align: center;
+    width: 100%;
+    padding: 1;
+    text-style: bold;
+}
+
+#score_big.excellent {
+    color: $success;
+}
+
+#score_big.good {
+    color: $warning;
+}
+
+#score_big.needs_work {
+    color: $error;
+}
+
+#time_display {
+    text-align: center;
+    width: 100%;
+    color: $text-muted;
+}
+
+#breakdown_row {
+    height: auto;
+    width: 100%;
+    margin-top: 1;
+}
+
+.breakdown {
+    width: 1fr;
+    padding: 0 1;
+}
+
+#incorrect_title {
+    color: $error;
+    text-style: bold;
+    padding: 1 0;
+}
+
+#incorrect_scroll {
+    height: 1fr;
+    border: solid $primary;
+    padding: 1;
+}
+
+.incorrect_item {
+    padding: 1;
+    margin-bottom: 1;
+}
+
+#nav_row {
+    height: 3;
+    width: 100%;
+    align: center middle;
+}
+
+#nav_row Button {
+    margin: 0 1;
+    width: 20;
+    text-align: center;
+}
+"""
+
+
+@lru_cache(maxsize=128)
+def _format_time_str(seconds: int) -> str:
+    """Format a quiz duration as dim "Time: Xm Ys" markup."""
+    mins, secs = divmod(seconds, 60)
+    return f"[dim]Time: {mins}m {secs}s[/dim]"
+
+
+def _breakdown_table(heading: str, rows: List[Tuple[str, Dict[str, int]]]) -> Table:
+    """Render (label, {correct, total}) rows as a two-column score table."""
+    table = Table(box=None, expand=True, pad_edge=False)
+    table.add_column(heading)
+    table.add_column("Score", justify="right")
+
+    for label, data in rows:
+        correct = data.get("correct", 0)
+        total = data.get("total", 0)
+        pct = (correct / total * 100) if total > 0 else 0
+        style = "green" if pct >= 70 else "red"
+        table.add_row(label, f"[{style}]{correct}/{total} ({pct:.0f}%)[/{style}]")
+
+    return table
+
 
 class Mode3ResultsScreen(Screen):
     """Results screen showing final quiz score and breakdown."""
 
-    CSS = """
-    Mode3ResultsScreen {
-        align: center middle;
-    }
-
-    #results_container {
-        width: 80;
-        height: 85%;
-        border: solid $primary;
-        background: $surface;
-        padding: 2;
-    }
-
-    #header_section {
-        height: auto;
-        width: 100%;
-    }
-
-    #title {
-        text-align: center;
-        width: 100%;
-        padding: 1;
-        color: $accent;
-        text-style: bold;
-    }
-
-    #score_big {
-        text-align: center;
-        width: 100%;
-        padding: 1;
-        text-style: bold;
-    }
-
-    #score_big.excellent {
-        color: $success;
-    }
-
-    #score_big.good {
-        color: $warning;
-    }
-
-    #score_big.needs_work {
-        color: $error;
-    }
-
-    #time_display {
-        text-align: center;
-        width: 100%;
-        color: $text-muted;
-    }
-
-    #incorrect_title {
-        color: $error;
-        text-style: bold;
-        padding: 1 0;
-    }
-
-    #incorrect_scroll {
-        height: 1fr;
-        border: solid $primary;
-        padding: 1;
-    }
-
-    .incorrect_item {
-        padding: 1;
-        margin-bottom: 1;
-    }
-
-    #nav_row {
-        height: 3;
-        width: 100%;
-        align: center middle;
-    }
-
-    #nav_row Button {
-        margin: 0 1;
-        width: 20;
-        text-align: center;
-    }
-    """
+    CSS = _RESULTS_CSS
 
     BINDINGS = [
         Binding("escape", "main_menu", "Main Menu", show=True),
@@ -106,19 +168,35 @@ class Mode3ResultsScreen(Screen):
         """
         super().__init__()
         self.results = results
+        self._incorrect: List[Dict[str, Any]] = results.get("incorrect_questions", [])
+        # Number of incorrect items mounted so far (the rest load on scroll)
+        self._incorrect_shown = 0
+        self._time_str = self._format_time()
+        # Difficulty breakdown in level order, sorted once per results
+        self._sorted_diffs = sorted(
+            results.get("by_difficulty", {}).items(),
+            key=lambda x: _DIFF_RANK.get(x[0], 99),
+        )
+        # Widget references, cached in on_mount
+        self._incorrect_scroll: VerticalScroll
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Header()
 
-        incorrect = self.results.get("incorrect_questions", [])
+        incorrect = self._incorrect
 
         with Container(id="results_container"):
             # Header section (fixed height)
             with Container(id="header_section"):
                 yield Static("[bold cyan]Quiz Complete![/bold cyan]", id="title")
                 yield self._create_score_display()
-                yield Static(self._format_time(), id="time_display")
+                yield Static(self._time_str, id="time_display")
+
+            # Score breakdowns, side by side
+            with Horizontal(id="breakdown_row"):
+                yield from self._create_topic_breakdown()
+                yield from self._create_difficulty_breakdown()
 
             # Incorrect questions scroll area (takes remaining space)
             if incorrect:
@@ -127,8 +205,7 @@ class Mode3ResultsScreen(Screen):
                     id="incorrect_title",
                 )
                 with VerticalScroll(id="incorrect_scroll"):
-                    for i, q in enumerate(incorrect):
-                        yield self._create_incorrect_item(i + 1, q)
+                    yield from self._next_incorrect_items()
 
             # Navigation buttons (fixed height at bottom)
             with Horizontal(id="nav_row"):
@@ -137,6 +214,35 @@ class Mode3ResultsScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Start filling in the remaining incorrect items as the list scrolls."""
+        if self._incorrect_shown < len(self._incorrect):
+            scroll = self.query_one("#incorrect_scroll", VerticalScroll)
+            self._incorrect_scroll = scroll
+            # Re-check on scroll, and after each layout (until the view is full)
+            self.watch(scroll, "scroll_y", self._load_more_incorrect, init=False)
+            self.watch(scroll, "virtual_size", self._load_more_incorrect, init=False)
+
+    def _next_incorrect_items(self) -> List[Static]:
+        """Build the next batch of incorrect question items."""
+        start = self._incorrect_shown
+        batch = self._incorrect[start : start + INCORRECT_BATCH]
+        self._incorrect_shown += len(batch)
+        return [
+            self._create_incorrect_item(start + i + 1, q) for i, q in enumerate(batch)
+        ]
+
+    async def _load_more_incorrect(self) -> None:
+        """Mount another batch once the user is within a page of the end."""
+        if self._incorrect_shown >= len(self._incorrect):
+            return
+        scroll = self._incorrect_scroll
+        if scroll.max_scroll_y - scroll.scroll_y > scroll.size.height:
+            return
+        await scroll.mount(*self._next_incorrect_items())
+        # Check again once laid out, in case the view still isn't full
+        self.call_after_refresh(self._load_more_incorrect)
+
     def _create_score_display(self) -> Static:
         """Create the main score display."""
         score = self.results.get("score", 0)
@@ -144,92 +250,45 @@ class Mode3ResultsScreen(Screen):
         pct = self.results.get("percentage", 0)
 
         # Determine grade
-        if pct >= 80:
-            grade_class = "excellent"
-            grade_text = "Excellent!"
-        elif pct >= 60:
-            grade_class = "good"
-            grade_text = "Good job!"
-        else:
-            grade_class = "needs_work"
-            grade_text = "Keep practicing!"
-
-        text = f"[bold {grade_class}]{score}/{total}[/bold {grade_class}] ({pct:.1f}%)\n{grade_text}"
+        _, grade_class, template = next(
+            (grade for grade in _SCORE_TEMPLATES if pct >= grade[0]),
+            _SCORE_TEMPLATES[-1],
+        )
+
+        text = template.format(s=score, t=total, p=pct)
         widget = Static(text, id="score_big")
         widget.add_class(grade_class)
         return widget
 
     def _format_time(self) -> str:
         """Format total time."""
-        seconds = self.results.get("time_total", 0)
-        mins = seconds // 60
-        secs = seconds % 60
-        return f"[dim]Time: {mins}m {secs}s[/dim]"
+        return _format_time_str(int(self.results.get("time_total", 0)))
 
-    def _create_topic_breakdown(self) -> Container:
+    def _create_topic_breakdown(self) -> ComposeResult:
         """Create topic breakdown display."""
-        container = Container()
         by_topic = self.results.get("by_topic", {})
-
-        for topic, data in sorted(by_topic.items()):
-            correct = data.get("correct", 0)
-            total = data.get("total", 0)
-            pct = (correct / total * 100) if total > 0 else 0
-
-            row = Horizontal(classes="breakdown_row")
-            label = Static(topic.replace("_", " ").title(), classes="breakdown_label")
-            value_class = "good" if pct >= 70 else "bad"
-            value = Static(
-                f"{correct}/{total} ({pct:.0f}%)",
-                classes=f"breakdown_value {value_class}",
-            )
-
-            container.compose_add_child(row)
-            row.compose_add_child(label)
-            row.compose_add_child(value)
-
-        return container
-
-    def _create_difficulty_breakdown(self) -> Container:
+        if by_topic:
+            rows = [
+                (format_topic_name(topic), data)
+                for topic, data in sorted(by_topic.items())
+            ]
+            yield Static(_breakdown_table("Topic", rows), classes="breakdown")
+
+    def _create_difficulty_breakdown(self) -> ComposeResult:
         """Create difficulty breakdown display."""
-        container = Container()
-        by_diff = self.results.get("by_difficulty", {})
-
-        # Order difficulties
-        order = ["beginner", "intermediate", "advanced", "elite"]
-        sorted_diffs = sorted(
-            by_diff.items(), key=lambda x: order.index(x[0]) if x[0] in order else 99
-        )
-
-        for diff, data in sorted_diffs:
-            correct = data.get("correct", 0)
-            total = data.get("total", 0)
-            pct = (correct / total * 100) if total > 0 else 0
-
-            row = Horizontal(classes="breakdown_row")
-            label = Static(diff.title(), classes="breakdown_label")
-            value_class = "good" if pct >= 70 else "bad"
-            value = Static(
-                f"{correct}/{total} ({pct:.0f}%)",
-                classes=f"breakdown_value {value_class}",
-            )
-
-            container.compose_add_child(row)
-            row.compose_add_child(label)
-            row.compose_add_child(value)
-
-        return container
+        if self._sorted_diffs:
+            rows = [(format_topic_name(d), data) for d, data in self._sorted_diffs]
+            yield Static(_breakdown_table("Difficulty", rows), classes="breakdown")
 
     def _create_incorrect_item(self, num: int, item: Dict[str, Any]) -> Static:
         """Create an incorrect question display item."""
-        question = item.get("question", "")
-        your_answer = item.get("your_answer", "")
-        correct_answer = item.get("correct_answer", "")
-
-        text = (
-            f"[bold]{num}. {question}[/bold]\n"
-            f"   Your answer: [red]{your_answer}[/red]\n"
-            f"   Correct: [green]{correct_answer}[/green]\n"
+        text = _INCORRECT_ITEM.format_map(
+            {
+                "num": num,
+                "question": item.get("question", ""),
+                "your_answer": item.get("your_answer", ""),
+                "correct_answer": item.get("correct_answer", ""),
+            }
         )
         return Static(text, classes="incorrect_item")
 
@@ -1,94 +1,117 @@
 """Mode 3: Quiz System - Setup Screen."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal
 from textual.widgets import Header, Footer, Button, Static, Label, Select
 from textual.binding import Binding
 
-from ...quiz import QuizEngine
+from ...quiz import QuizEngine, format_topic_name
+
+# Stylesheet, parsed once by Textual and shared by every instance
+_SETUP_CSS = """
+Mode3SetupScreen {
+    align: center middle;
+}
+
+#setup_container {
+    width: 65;
+    height: auto;
+    border: solid $primary;
+    background: $surface;
+    padding: 2;
+}
+
+#title {
+    text-align: center;
+    width: 100%;
+    padding: 1;
+    color: $accent;
+    text-style: bold;
+}
+
+#subtitle {
+    text-align: center;
+    width: 100%;
+    padding: 0 0 2 0;
+    color: $text-muted;
+}
+
+.section_title {
+    width: 100%;
+    padding: 1 0 0 0;
+    color: $accent;
+    text-style: bold;
+}
+
+.input_group {
+    height: auto;
+    margin-bottom: 1;
+}
+
+.label {
+    width: 18;
+    color: $text;
+    content-align: left middle;
+}
+
+Select {
+    width: 1fr;
+}
+
+.button_row {
+    margin-top: 2;
+    height: auto;
+    align: center middle;
+}
+
+Button {
+    margin: 0 1;
+    width: 20;
+    text-align: center;
+}
+
+.help_text {
+    color: $text-muted;
+    text-align: center;
+    width: 100%;
+    padding: 1 0 0 0;
+}
+
+#question_count {
+    text-align: center;
+    width: 100%;
+    padding: 1 0;
+    color: $text-muted;
+}
+"""
+
+
+# Select options as (label, value) pairs
+SelectOptions = Tuple[Tuple[str, str], ...]
+
+
+@lru_cache(maxsize=8)
+def _topic_options(topics: Tuple[str, ...]) -> SelectOptions:
+    """Build the topic dropdown options, led by an "All Topics" entry."""
+    return (("All Topics", "all"),) + tuple((format_topic_name(t), t) for t in topics)
+
+
+@lru_cache(maxsize=8)
+def _difficulty_options(difficulties: Tuple[str, ...]) -> SelectOptions:
+    """Build the difficulty dropdown options, led by an "All Levels" entry."""
+    return (("All Levels", "all"),) + tuple(
+        (format_topic_name(d), d) for d in difficulties
+    )
 
 
 class Mode3SetupScreen(Screen):
     """Quiz setup screen for topic, difficulty, and question count selection."""
 
-    CSS = """
-    Mode3SetupScreen {
-        align: center middle;
-    }
-
-    #setup_container {
-        width: 65;
-        height: auto;
-        border: solid $primary;
-        background: $surface;
-        padding: 2;
-    }
-
-    #title {
-        text-align: center;
-        width: 100%;
-        padding: 1;
-        color: $accent;
-        text-style: bold;
-    }
-
-    #subtitle {
-        text-align: center;
-        width: 100%;
-        padding: 0 0 2 0;
-        color: $text-muted;
-    }
-
-    .section_title {
-        width: 100%;
-        padding: 1 0 0 0;
-        color: $accent;
-        text-style: bold;
-    }
-
-    .input_group {
-        height: auto;
-        margin-bottom: 1;
-    }
-
-    .label {
-        width: 18;
-        color: $text;
-        content-align: left middle;
-    }
-
-    Select {
-        width: 1fr;
-    }
-
-    .button_row {
-        margin-top: 2;
-        height: auto;
-        align: center middle;
-    }
-
-    Button {
-        margin: 0 1;
-        width: 20;
-        text-align: center;
-    }
-
-    .help_text {
-        color: $text-muted;
-        text-align: center;
-        width: 100%;
-        padding: 1 0 0 0;
-    }
-
-    #question_count {
-        text-align: center;
-        width: 100%;
-        padding: 1 0;
-        color: $text-muted;
-    }
-    """
+    CSS = _SETUP_CSS
 
     BINDINGS = [
         Binding("escape", "back", "Back", show=True),
@@ -102,6 +125,15 @@ class Mode3SetupScreen(Screen):
         self.selected_topic: Optional[str] = None
         self.selected_difficulty: Optional[str] = None
         self.selected_count: int = 10
+        # Topics and difficulties in the bank, read once per screen
+        self._topics = tuple(self.engine.get_available_topics())
+        self._difficulties = tuple(self.engine.get_available_difficulties())
+        # Matching question counts keyed by (topic, difficulty) filter
+        self._count_cache: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+        # Text currently shown in the count label, to skip identical updates
+        self._last_count_text = ""
+        # Widget references, cached in on_mount
+        self._count_label: Static
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -115,12 +147,8 @@ class Mode3SetupScreen(Screen):
             yield Static("Select Topic:", classes="section_title")
             with Horizontal(classes="input_group"):
                 yield Label("Topic:", classes="label")
-                topics = self.engine.get_available_topics()
-                topic_options = [("All Topics", "all")] + [
-                    (t.replace("_", " ").title(), t) for t in topics
-                ]
                 yield Select(
-                    topic_options,
+                    _topic_options(self._topics),
                     id="topic_select",
                     value="all",
                 )
@@ -128,10 +156,8 @@ class Mode3SetupScreen(Screen):
             # Difficulty selection
             with Horizontal(classes="input_group"):
                 yield Label("Difficulty:", classes="label")
-                diffs = self.engine.get_available_difficulties()
-                diff_options = [("All Levels", "all")] + [(d.title(), d) for d in diffs]
                 yield Select(
-                    diff_options,
+                    _difficulty_options(self._difficulties),
                     id="difficulty_select",
                     value="all",
                 )
@@ -151,8 +177,9 @@ class Mode3SetupScreen(Screen):
                 )
 
             # Question count display
+            self._last_count_text = self._get_count_text()
             yield Static(
-                self._get_count_text(),
+                self._last_count_text,
                 id="question_count",
             )
 
@@ -169,31 +196,68 @@ class Mode3SetupScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Cache the count label and pre-compute every filter combination."""
+        self._count_label = self.query_one("#question_count", Static)
+        self._prewarm_quiz_module()
+        for topic in (None, *self._topics):
+            for diff in (None, *self._difficulties):
+                self._question_count(topic, diff)
+
+    @work(thread=True, exclusive=True, group="prewarm")
+    def _prewarm_quiz_module(self) -> None:
+        """Import the quiz screen in the background, before Start is pressed."""
+        from . import mode3_quiz  # noqa: F401
+
+    def _question_count(self, topic: Optional[str], difficulty: Optional[str]) -> int:
+        """
+        Count questions matching the filters, caching each combination.
+
+        Args:
+            topic: Topic filter (None for all topics)
+            difficulty: Difficulty filter (None for all levels)
+
+        Returns:
+            Number of matching questions
+        """
+        key = (topic, difficulty)
+        count = self._count_cache.get(key)
+        if count is None:
+            count = self.engine.get_question_count(topic=topic, difficulty=difficulty)
+            self._count_cache[key] = count
+        return count
+
     def _get_count_text(self) -> str:
         """Get available question count text."""
         topic = self.selected_topic if self.selected_topic != "all" else None
         diff = self.selected_difficulty if self.selected_difficulty != "all" else None
-        count = self.engine.get_question_count(topic=topic, difficulty=diff)
+        count = self._question_count(topic, diff)
         return f"[dim]{count} questions available[/dim]"
 
     def _update_count_display(self) -> None:
-        """Update the question count display."""
-        count_label = self.query_one("#question_count", Static)
-        count_label.update(self._get_count_text())
+        """Update the question count display if its text has changed."""
+        text = self._get_count_text()
+        if text != self._last_count_text:
+            self._last_count_text = text
+            self._count_label.update(text)
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle selection changes."""
         select_id = event.select.id
         value = str(event.value) if event.value else None
 
+        if select_id == "count_select":
+            # Doesn't affect the available count
+            self.selected_count = int(value) if value else 10
+            return
+
         if select_id == "topic_select":
             self.selected_topic = value
-            self._update_count_display()
         elif select_id == "difficulty_select":
             self.selected_difficulty = value
-            self._update_count_display()
-        elif select_id == "count_select":
-            self.selected_count = int(value) if value else 10
+        else:
+            return
+        self._update_count_display()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -217,7 +281,7 @@ class Mode3SetupScreen(Screen):
         )
 
         # Check if we have questions
-        available = self.engine.get_question_count(topic=topic, difficulty=difficulty)
+        available = self._question_count(topic, difficulty)
         if available == 0:
             self.notify(
                 "No questions match the selected filters",
@@ -225,7 +289,7 @@ class Mode3SetupScreen(Screen):
             )
             return
 
-        # Start quiz
+        # Start quiz (usually already imported by _prewarm_quiz_module)
         from .mode3_quiz import Mode3QuizScreen
 
         self.app.push_screen(
@@ -1,6 +1,9 @@
 """Mode 4: Session Tracker - Detail Screen."""
 
-from typing import Any, Dict, Optional
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from rich.table import Table
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal
@@ -9,108 +12,160 @@ from textual.binding import Binding
 
 from ...database.service import get_poker_session_by_id, delete_poker_session
 
+# Stylesheet, parsed once by Textual and shared by every instance
+_DETAIL_CSS = """
+Mode4DetailScreen {
+    align: center middle;
+}
+
+#detail_container {
+    width: 70;
+    height: auto;
+    border: solid $primary;
+    background: $surface;
+    padding: 2;
+}
+
+#title {
+    text-align: center;
+    width: 100%;
+    padding: 1;
+    color: $accent;
+    text-style: bold;
+}
+
+#profit_display {
+    text-align: center;
+    width: 100%;
+    padding: 2;
+    text-style: bold;
+    background: $surface-lighten-1;
+    border: solid $primary-lighten-2;
+    margin-bottom: 1;
+}
+
+#info_section {
+    width: 100%;
+    height: auto;
+    padding: 1;
+    margin-bottom: 1;
+}
+
+#notes_section {
+    width: 100%;
+    height: auto;
+    padding: 1;
+    background: $surface-lighten-1;
+    border: solid $primary-lighten-2;
+    margin-bottom: 1;
+}
+
+.section_label {
+    color: $text-muted;
+    margin-bottom: 1;
+}
+
+.section_content {
+    width: 100%;
+}
+
+.button_row {
+    margin-top: 1;
+    height: auto;
+    align: center middle;
+}
+
+Button {
+    margin: 0 1;
+    width: 18;
+    text-align: center;
+}
+
+#loading {
+    text-align: center;
+    width: 100%;
+    padding: 2;
+    color: $text-muted;
+}
+
+#not_found {
+    text-align: center;
+    width: 100%;
+    padding: 2;
+    color: $error;
+}
+"""
+
+
+# Label/value rows of the info table
+InfoRows = Tuple[Tuple[str, str], ...]
+
+
+@lru_cache(maxsize=64)
+def _format_session(fields: Tuple[Tuple[str, Any], ...]) -> Tuple[str, InfoRows]:
+    """
+    Format a session for display, once per distinct set of field values.
+
+    Args:
+        fields: The session dict's items as a sorted tuple (hashable for the cache)
+
+    Returns:
+        Tuple of (profit display markup, info table rows)
+    """
+    session = dict(fields)
+
+    profit = session.get("profit_loss", 0)
+    if profit >= 0:
+        profit_str = f"[bold green]+${profit:,.2f}[/bold green]"
+        profit_row = f"[green]+${profit:,.2f}[/green]"
+    else:
+        profit_str = f"[bold red]-${abs(profit):,.2f}[/bold red]"
+        profit_row = f"[red]-${abs(profit):,.2f}[/red]"
+
+    # Duration
+    duration = session.get("duration_minutes")
+    if duration:
+        hours = duration // 60
+        mins = duration % 60
+        duration_str = f"{hours}h {mins}m" if hours else f"{mins}m"
+    else:
+        duration_str = "-"
+
+    # Hourly rate
+    hourly = session.get("hourly_rate")
+    if hourly is None:
+        hourly_str = "-"
+    elif hourly >= 0:
+        hourly_str = f"[green]+${hourly:,.2f}/hr[/green]"
+    else:
+        hourly_str = f"[red]-${abs(hourly):,.2f}/hr[/red]"
+
+    date = session.get("date", "")
+    game_type = session.get("game_type", "cash") or "cash"
+    rows = [
+        ("Date:", date[:10] if date else "-"),
+        ("Stake:", session.get("stake_level", "-") or "-"),
+        ("Game Type:", game_type.capitalize()),
+        ("Buy-in:", f"${session.get('buy_in', 0):,.2f}"),
+        ("Cash-out:", f"${session.get('cash_out', 0):,.2f}"),
+        ("Profit/Loss:", profit_row),
+        ("Duration:", duration_str),
+        ("Hourly Rate:", hourly_str),
+    ]
+
+    # Hands played (if present)
+    hands = session.get("hands_played")
+    if hands:
+        rows.append(("Hands Played:", f"{hands:,}"))
+
+    rows.append(("Location:", session.get("location", "") or "-"))
+    return profit_str, tuple(rows)
+
 
 class Mode4DetailScreen(Screen):
     """Session detail view screen."""
 
-    CSS = """
-    Mode4DetailScreen {
-        align: center middle;
-    }
-
-    #detail_container {
-        width: 70;
-        height: auto;
-        border: solid $primary;
-        background: $surface;
-        padding: 2;
-    }
-
-    #title {
-        text-align: center;
-        width: 100%;
-        padding: 1;
-        color: $accent;
-        text-style: bold;
-    }
-
-    #profit_display {
-        text-align: center;
-        width: 100%;
-        padding: 2;
-        text-style: bold;
-        background: $surface-lighten-1;
-        border: solid $primary-lighten-2;
-        margin-bottom: 1;
-    }
-
-    #info_section {
-        width: 100%;
-        height: auto;
-        padding: 1;
-        margin-bottom: 1;
-    }
-
-    .info_row {
-        width: 100%;
-        height: auto;
-        margin-bottom: 0;
-    }
-
-    .info_label {
-        width: 18;
-        color: $text-muted;
-    }
-
-    .info_value {
-        width: 1fr;
-    }
-
-    .info_value.positive {
-        color: $success;
-    }
-
-    .info_value.negative {
-        color: $error;
-    }
-
-    #notes_section {
-        width: 100%;
-        height: auto;
-        padding: 1;
-        background: $surface-lighten-1;
-        border: solid $primary-lighten-2;
-        margin-bottom: 1;
-    }
-
-    .section_label {
-        color: $text-muted;
-        margin-bottom: 1;
-    }
-
-    .section_content {
-        width: 100%;
-    }
-
-    .button_row {
-        margin-top: 1;
-        height: auto;
-        align: center middle;
-    }
-
-    Button {
-        margin: 0 1;
-        width: 18;
-        text-align: center;
-    }
-
-    #not_found {
-        text-align: center;
-        width: 100%;
-        padding: 2;
-        color: $error;
-    }
-    """
+    CSS = _DETAIL_CSS
 
     BINDINGS = [
         Binding("escape", "back", "Back", show=True),
@@ -129,130 +184,57 @@ class Mode4DetailScreen(Screen):
 
         with Container(id="detail_container"):
             yield Static("[bold cyan]Session Details[/bold cyan]", id="title")
-
-            # Load session data
-            self.session = get_poker_session_by_id(self.session_id)
-
-            if not self.session:
-                yield Static("Session not found", id="not_found")
-                with Horizontal(classes="button_row"):
-                    yield Button("Back", id="back_btn", variant="default")
-            else:
-                # Profit display (large, centered)
-                profit = self.session.get("profit_loss", 0)
-                if profit >= 0:
-                    profit_str = f"[bold green]+${profit:,.2f}[/bold green]"
-                else:
-                    profit_str = f"[bold red]-${abs(profit):,.2f}[/bold red]"
-                yield Static(profit_str, id="profit_display")
-
-                # Info section
-                with Container(id="info_section"):
-                    # Date
-                    date = self.session.get("date", "")
-                    date_str = date[:10] if date else "-"
-                    with Horizontal(classes="info_row"):
-                        yield Static("Date:", classes="info_label")
-                        yield Static(date_str, classes="info_value")
-
-                    # Stake level
-                    stake = self.session.get("stake_level", "-") or "-"
-                    with Horizontal(classes="info_row"):
-                        yield Static("Stake:", classes="info_label")
-                        yield Static(stake, classes="info_value")
-
-                    # Game type
-                    game_type = self.session.get("game_type", "cash") or "cash"
-                    with Horizontal(classes="info_row"):
-                        yield Static("Game Type:", classes="info_label")
-                        yield Static(game_type.capitalize(), classes="info_value")
-
-                    # Buy-in
-                    buy_in = self.session.get("buy_in", 0)
-                    with Horizontal(classes="info_row"):
-                        yield Static("Buy-in:", classes="info_label")
-                        yield Static(f"${buy_in:,.2f}", classes="info_value")
-
-                    # Cash-out
-                    cash_out = self.session.get("cash_out", 0)
-                    with Horizontal(classes="info_row"):
-                        yield Static("Cash-out:", classes="info_label")
-                        yield Static(f"${cash_out:,.2f}", classes="info_value")
-
-                    # Profit/Loss
-                    profit_class = (
-                        "info_value positive" if profit >= 0 else "info_value negative"
-                    )
-                    with Horizontal(classes="info_row"):
-                        yield Static("Profit/Loss:", classes="info_label")
-                        yield Static(
-                            (
-                                f"+${profit:,.2f}"
-                                if profit >= 0
-                                else f"-${abs(profit):,.2f}"
-                            ),
-                            classes=profit_class,
-                        )
-
-                    # Duration
-                    duration = self.session.get("duration_minutes")
-                    if duration:
-                        hours = duration // 60
-                        mins = duration % 60
-                        duration_str = f"{hours}h {mins}m" if hours else f"{mins}m"
-                    else:
-                        duration_str = "-"
-                    with Horizontal(classes="info_row"):
-                        yield Static("Duration:", classes="info_label")
-                        yield Static(duration_str, classes="info_value")
-
-                    # Hourly rate
-                    hourly = self.session.get("hourly_rate")
-                    if hourly is not None:
-                        hourly_class = (
-                            "info_value positive"
-                            if hourly >= 0
-                            else "info_value negative"
-                        )
-                        hourly_str = (
-                            f"+${hourly:,.2f}/hr"
-                            if hourly >= 0
-                            else f"-${abs(hourly):,.2f}/hr"
-                        )
-                    else:
-                        hourly_class = "info_value"
-                        hourly_str = "-"
-                    with Horizontal(classes="info_row"):
-                        yield Static("Hourly Rate:", classes="info_label")
-                        yield Static(hourly_str, classes=hourly_class)
-
-                    # Hands played (if present)
-                    hands = self.session.get("hands_played")
-                    if hands:
-                        with Horizontal(classes="info_row"):
-                            yield Static("Hands Played:", classes="info_label")
-                            yield Static(f"{hands:,}", classes="info_value")
-
-                    # Location
-                    location = self.session.get("location", "") or "-"
-                    with Horizontal(classes="info_row"):
-                        yield Static("Location:", classes="info_label")
-                        yield Static(location, classes="info_value")
-
-                # Notes section (if present)
-                notes = self.session.get("notes")
-                if notes:
-                    with Container(id="notes_section"):
-                        yield Static("Notes:", classes="section_label")
-                        yield Static(notes, classes="section_content")
-
-                # Buttons
-                with Horizontal(classes="button_row"):
-                    yield Button("Delete", id="delete_btn", variant="error")
-                    yield Button("Back", id="back_btn", variant="default")
+            # Placeholder until on_mount has fetched the session
+            yield Static("Loading session...", id="loading")
 
         yield Footer()
 
+    async def on_mount(self) -> None:
+        """Fetch the session off the event loop, then show its details."""
+        self.session = await asyncio.to_thread(get_poker_session_by_id, self.session_id)
+        container = self.query_one("#detail_container", Container)
+        with self.app.batch_update():
+            await self.query_one("#loading", Static).remove()
+            await container.mount_compose(self._compose_detail())
+
+    def _compose_detail(self) -> ComposeResult:
+        """Create the session detail widgets (or a not-found message)."""
+        if not self.session:
+            yield Static("Session not found", id="not_found")
+            yield Horizontal(
+                Button("Back", id="back_btn", variant="default"),
+                classes="button_row",
+            )
+        else:
+            profit_str, rows = _format_session(tuple(sorted(self.session.items())))
+
+            # Profit display (large, centered)
+            yield Static(profit_str, id="profit_display")
+
+            # Info section, one two-column table
+            table = Table(box=None, show_header=False, padding=0, expand=True)
+            table.add_column(width=18, style="dim")
+            table.add_column(ratio=1)
+            for label, value in rows:
+                table.add_row(label, value)
+            yield Static(table, id="info_section")
+
+            # Notes section (if present)
+            notes = self.session.get("notes")
+            if notes:
+                yield Container(
+                    Static("Notes:", classes="section_label"),
+                    Static(notes, classes="section_content"),
+                    id="notes_section",
+                )
+
+            # Buttons
+            yield Horizontal(
+                Button("Delete", id="delete_btn", variant="error"),
+                Button("Back", id="back_btn", variant="default"),
+                classes="button_row",
+            )
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id
@@ -1,15 +1,98 @@
 """Mode 4: Session Tracker - Entry Screen."""
 
+import re
 from datetime import datetime, timezone
+from typing import Dict, Optional
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal
 from textual.widgets import Header, Footer, Button, Static, Input, Select, TextArea
 from textual.binding import Binding
+from textual.timer import Timer
 from textual.validation import Number
 
 from ...database.service import save_poker_session
 
+# Seconds of typing inactivity before the profit display is refreshed
+PROFIT_UPDATE_DELAY = 0.05
+
+# Stake level dropdown options as (label, value)
+STAKE_OPTIONS = (
+    ("$0.25/0.50 NL", "0.25/0.50"),
+    ("1/2 NL", "1/2"),
+    ("1/3 NL", "1/3"),
+    ("2/5 NL", "2/5"),
+    ("5/10 NL", "5/10"),
+    ("NL2", "NL2"),
+    ("NL5", "NL5"),
+    ("NL10", "NL10"),
+    ("NL25", "NL25"),
+    ("NL50", "NL50"),
+    ("NL100", "NL100"),
+    ("NL200", "NL200"),
+    ("Other", "other"),
+)
+
+# Game type dropdown options as (label, value)
+GAME_TYPE_OPTIONS = (
+    ("Cash Game", "cash"),
+    ("Tournament", "tournament"),
+)
+
+# Characters float() accepts in an amount (sign, digits, point, exponent),
+# checked before calling it to skip obviously bad keystrokes
+_NUM_RE = re.compile(r"[+-]?[\d_]*\.?[\d_]*(?:[eE][+-]?[\d_]*)?")
+
+# Ids of the single-line form inputs
+INPUT_IDS = (
+    "date_input",
+    "buyin_input",
+    "cashout_input",
+    "duration_input",
+    "hands_input",
+    "location_input",
+)
+
+
+def _parse_cents(text: str) -> Optional[int]:
+    """Parse a dollar amount into whole cents (0 if blank, None if not a number)."""
+    # Same leniency as the save path, which strips the text and calls float()
+    text = text.strip()
+    if not text:
+        return 0
+    if not _NUM_RE.fullmatch(text):
+        return None
+    try:
+        return round(float(text) * 100)
+    except (ValueError, OverflowError):
+        # Partial input such as "-", "." or "1e"
+        return None
+
+
+def _parse_date(text: str) -> datetime:
+    """
+    Parse a strict YYYY-MM-DD date as midnight UTC.
+
+    Args:
+        text: Date string entered by the user
+
+    Returns:
+        Timezone-aware datetime
+
+    Raises:
+        ValueError: If the text is not a valid YYYY-MM-DD date
+    """
+    # fromisoformat also accepts other ISO forms (e.g. 20240115), so pin the shape
+    if len(text) != 10 or text[4] != "-" or text[7] != "-":
+        raise ValueError(f"Invalid date: {text!r}")
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+
+
+def _format_dollars(cents: int) -> str:
+    """Format an amount in cents as unsigned dollars (e.g., "$1,234.56")."""
+    dollars, rem = divmod(abs(cents), 100)
+    return f"${dollars:,}.{rem:02d}"
+
 
 class Mode4EntryScreen(Screen):
     """Session entry form screen."""
@@ -120,8 +203,18 @@ class Mode4EntryScreen(Screen):
     def __init__(self) -> None:
         """Initialize the entry screen."""
         super().__init__()
-        self.buy_in_value: float = 0.0
-        self.cash_out_value: float = 0.0
+        # Running amounts in whole cents, so the profit is exact
+        self.buy_in_value: int = 0
+        self.cash_out_value: int = 0
+        # Profit currently shown in the display, to skip identical repaints
+        self._last_profit_cents: int = 0
+        self._profit_timer: Optional[Timer] = None
+        # Widget references, cached in on_mount
+        self._inputs: Dict[str, Input] = {}
+        self._notes_input: TextArea
+        self._stake_select: Select
+        self._game_type_select: Select
+        self._profit_display: Static
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -144,21 +237,7 @@ class Mode4EntryScreen(Screen):
             with Horizontal(classes="input_group"):
                 yield Static("Stake Level:", classes="label")
                 yield Select(
-                    [
-                        ("$0.25/0.50 NL", "0.25/0.50"),
-                        ("1/2 NL", "1/2"),
-                        ("1/3 NL", "1/3"),
-                        ("2/5 NL", "2/5"),
-                        ("5/10 NL", "5/10"),
-                        ("NL2", "NL2"),
-                        ("NL5", "NL5"),
-                        ("NL10", "NL10"),
-                        ("NL25", "NL25"),
-                        ("NL50", "NL50"),
-                        ("NL100", "NL100"),
-                        ("NL200", "NL200"),
-                        ("Other", "other"),
-                    ],
+                    STAKE_OPTIONS,
                     id="stake_select",
                     prompt="Select stake level",
                 )
@@ -167,10 +246,7 @@ class Mode4EntryScreen(Screen):
             with Horizontal(classes="input_group"):
                 yield Static("Game Type:", classes="label")
                 yield Select(
-                    [
-                        ("Cash Game", "cash"),
-                        ("Tournament", "tournament"),
-                    ],
+                    GAME_TYPE_OPTIONS,
                     id="game_type_select",
                     value="cash",
                 )
@@ -241,41 +317,64 @@ class Mode4EntryScreen(Screen):
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Cache references to the form widgets."""
+        self._inputs = {
+            input_id: self.query_one(f"#{input_id}", Input) for input_id in INPUT_IDS
+        }
+        self._notes_input = self.query_one("#notes_input", TextArea)
+        self._stake_select = self.query_one("#stake_select", Select)
+        self._game_type_select = self.query_one("#game_type_select", Select)
+        self._profit_display = self.query_one("#profit_display", Static)
+
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle input changes to update profit display."""
         input_id = event.input.id
+        if input_id not in ("buyin_input", "cashout_input"):
+            return
+
+        cents = _parse_cents(event.value)
+        if cents is None:
+            return  # Not a number yet; keep showing the last valid amount
 
         if input_id == "buyin_input":
-            try:
-                self.buy_in_value = float(event.value) if event.value else 0.0
-            except ValueError:
-                self.buy_in_value = 0.0
-            self._update_profit_display()
+            self.buy_in_value = cents
+        else:
+            self.cash_out_value = cents
+        self._schedule_profit_update()
 
-        elif input_id == "cashout_input":
-            try:
-                self.cash_out_value = float(event.value) if event.value else 0.0
-            except ValueError:
-                self.cash_out_value = 0.0
-            self._update_profit_display()
+    def _schedule_profit_update(self) -> None:
+        """Refresh the profit display once a burst of keystrokes ends."""
+        if self._profit_timer is not None:
+            self._profit_timer.stop()
+        self._profit_timer = self.set_timer(
+            PROFIT_UPDATE_DELAY, self._update_profit_display
+        )
 
     def _update_profit_display(self) -> None:
-        """Update the profit display."""
+        """Update the profit display if the profit has changed."""
+        self._profit_timer = None
         profit = self.cash_out_value - self.buy_in_value
-        display = self.query_one("#profit_display", Static)
+        if profit == self._last_profit_cents:
+            return
+        self._last_profit_cents = profit
 
-        # Remove old classes
-        display.remove_class("positive", "negative", "zero")
+        amount = _format_dollars(profit)
+        display = self._profit_display
 
-        if profit > 0:
-            display.update(f"Profit/Loss: [green]+${profit:,.2f}[/green]")
-            display.add_class("positive")
-        elif profit < 0:
-            display.update(f"Profit/Loss: [red]-${abs(profit):,.2f}[/red]")
-            display.add_class("negative")
-        else:
-            display.update("Profit/Loss: $0.00")
-            display.add_class("zero")
+        # Swap classes and text in one repaint
+        with self.app.batch_update():
+            display.remove_class("positive", "negative", "zero")
+
+            if profit > 0:
+                display.update(f"Profit/Loss: [green]+{amount}[/green]")
+                display.add_class("positive")
+            elif profit < 0:
+                display.update(f"Profit/Loss: [red]-{amount}[/red]")
+                display.add_class("negative")
+            else:
+                display.update("Profit/Loss: $0.00")
+                display.add_class("zero")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -290,15 +389,11 @@ class Mode4EntryScreen(Screen):
 
     def _clear_form(self) -> None:
         """Clear all form inputs."""
-        self.query_one("#date_input", Input).value = ""
-        self.query_one("#buyin_input", Input).value = ""
-        self.query_one("#cashout_input", Input).value = ""
-        self.query_one("#duration_input", Input).value = ""
-        self.query_one("#hands_input", Input).value = ""
-        self.query_one("#location_input", Input).value = ""
-        self.query_one("#notes_input", TextArea).clear()
-        self.buy_in_value = 0.0
-        self.cash_out_value = 0.0
+        for form_input in self._inputs.values():
+            form_input.value = ""
+        self._notes_input.clear()
+        self.buy_in_value = 0
+        self.cash_out_value = 0
         self._update_profit_display()
         self.notify("Form cleared")
 
@@ -309,15 +404,16 @@ class Mode4EntryScreen(Screen):
     def action_save(self) -> None:
         """Save the session."""
         # Get values
-        date_str = self.query_one("#date_input", Input).value.strip()
-        stake_select = self.query_one("#stake_select", Select)
-        game_type_select = self.query_one("#game_type_select", Select)
-        buyin_str = self.query_one("#buyin_input", Input).value.strip()
-        cashout_str = self.query_one("#cashout_input", Input).value.strip()
-        duration_str = self.query_one("#duration_input", Input).value.strip()
-        hands_str = self.query_one("#hands_input", Input).value.strip()
-        location = self.query_one("#location_input", Input).value.strip()
-        notes = self.query_one("#notes_input", TextArea).text.strip()
+        inputs = self._inputs
+        date_str = inputs["date_input"].value.strip()
+        stake_select = self._stake_select
+        game_type_select = self._game_type_select
+        buyin_str = inputs["buyin_input"].value.strip()
+        cashout_str = inputs["cashout_input"].value.strip()
+        duration_str = inputs["duration_input"].value.strip()
+        hands_str = inputs["hands_input"].value.strip()
+        location = inputs["location_input"].value.strip()
+        notes = self._notes_input.text.strip()
 
         # Validate required fields
         errors = []
@@ -355,9 +451,7 @@ class Mode4EntryScreen(Screen):
         # Parse date
         if date_str:
             try:
-                date = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                    tzinfo=timezone.utc
-                )
+                date = _parse_date(date_str)
             except ValueError:
                 self.notify("Invalid date format. Use YYYY-MM-DD", severity="error")
                 return
@@ -386,13 +480,12 @@ class Mode4EntryScreen(Screen):
         # Save to database
         try:
             save_poker_session(session_data)
-            profit = cash_out - buy_in
-            if profit >= 0:
-                self.notify(f"Session saved! (+${profit:,.2f})", severity="information")
-            else:
-                self.notify(
-                    f"Session saved! (-${abs(profit):,.2f})", severity="information"
-                )
+            profit = round(cash_out * 100) - round(buy_in * 100)
+            sign = "+" if profit >= 0 else "-"
+            self.notify(
+                f"Session saved! ({sign}{_format_dollars(profit)})",
+                severity="information",
+            )
             self.app.pop_screen()
         except Exception as e:
             self.notify(f"Error saving session: {e}", severity="error")
@@ -1,15 +1,69 @@
 """Mode 4: Session Tracker - History Screen."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal
+from textual.coordinate import Coordinate
 from textual.widgets import Header, Footer, Button, Static, Select, DataTable
 from textual.binding import Binding
 
-from ...database.service import get_poker_sessions, delete_poker_session
+from ...database.service import (
+    delete_poker_session,
+    get_distinct_stake_levels,
+    get_poker_sessions,
+)
 from .mode4_detail import Mode4DetailScreen
 
+# Most sessions fetched for one time range
+HISTORY_LIMIT = 100
+
+# Time range dropdown options as (label, days back; "0" is all time)
+DAY_RANGE_OPTIONS = (
+    ("Last 7 days", "7"),
+    ("Last 30 days", "30"),
+    ("Last 90 days", "90"),
+    ("All time", "0"),
+)
+
+
+def _format_money(amount: float) -> str:
+    """Format a dollar amount (e.g., "$1,234.50")."""
+    return f"${amount:,.2f}"
+
+
+def _format_signed(amount: float, spec: str = ",.2f") -> str:
+    """Format a dollar amount with an explicit sign (e.g., "+$50.00")."""
+    if amount >= 0:
+        return f"+${amount:{spec}}"
+    return f"-${-amount:{spec}}"
+
+
+def _format_duration(minutes: Optional[int]) -> str:
+    """Format a duration in minutes as "Xh Ym" / "Ym" ("-" if unknown)."""
+    if not minutes:
+        return "-"
+    hours, mins = divmod(minutes, 60)
+    return f"{hours}h {mins}m" if hours else f"{mins}m"
+
+
+def _session_totals(sessions: List[Dict[str, Any]]) -> Tuple[float, int]:
+    """
+    Sum profit and playing time over sessions in a single pass.
+
+    Args:
+        sessions: Session records as returned by get_poker_sessions
+
+    Returns:
+        Tuple of (total profit/loss, total minutes played)
+    """
+    total_profit = 0.0
+    total_minutes = 0
+    for session in sessions:
+        total_profit += session.get("profit_loss", 0) or 0
+        total_minutes += session.get("duration_minutes", 0) or 0
+    return total_profit, total_minutes
+
 
 class Mode4HistoryScreen(Screen):
     """Session history screen with table view."""
@@ -104,10 +158,23 @@ class Mode4HistoryScreen(Screen):
         """Initialize the history screen."""
         super().__init__()
         self.sessions: List[Dict[str, Any]] = []
+        # Every stake's sessions in the selected time range, filtered in memory
+        self._all_sessions: List[Dict[str, Any]] = []
+        # Whether _all_sessions held the whole time range when it was loaded
+        self._range_complete: bool = False
         self.selected_days: int = 0  # Default to all time
         self.selected_stake: str | None = None
         self._loading: bool = False  # Guard against recursive loading
         self._stakes_loaded: bool = False  # Only load stake options once
+        # Sessions currently in the table, keyed by row key in display order
+        self._displayed: Dict[str, Dict[str, Any]] = {}
+        # (sessions, profit, minutes) the summary was last rendered for
+        self._summary_key: Optional[Tuple[int, float, int]] = None
+        # Widget references, cached in on_mount
+        self._summary_sessions: Static
+        self._summary_profit: Static
+        self._summary_hours: Static
+        self._summary_rate: Static
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -120,12 +187,7 @@ class Mode4HistoryScreen(Screen):
             with Horizontal(id="filter_row"):
                 yield Static("Time Range:")
                 yield Select(
-                    [
-                        ("Last 7 days", "7"),
-                        ("Last 30 days", "30"),
-                        ("Last 90 days", "90"),
-                        ("All time", "0"),
-                    ],
+                    DAY_RANGE_OPTIONS,
                     id="days_select",
                     value="0",  # Default to all time
                 )
@@ -158,6 +220,10 @@ class Mode4HistoryScreen(Screen):
     def on_mount(self) -> None:
         """Set up the table when mounted."""
         table = self.query_one("#table", DataTable)
+        self._summary_sessions = self.query_one("#summary_sessions", Static)
+        self._summary_profit = self.query_one("#summary_profit", Static)
+        self._summary_hours = self.query_one("#summary_hours", Static)
+        self._summary_rate = self.query_one("#summary_rate", Static)
 
         # Add columns
         table.add_column("Date", key="date", width=12)
@@ -185,130 +251,134 @@ class Mode4HistoryScreen(Screen):
         self._loading = True
 
         try:
-            self.sessions = get_poker_sessions(
-                days=self.selected_days,
-                stake_level=self.selected_stake,
-                limit=100,
+            self._all_sessions = get_poker_sessions(
+                days=self.selected_days, limit=HISTORY_LIMIT
             )
+            self._range_complete = len(self._all_sessions) < HISTORY_LIMIT
 
             # Update stake filter options only once to avoid event loops
             if not self._stakes_loaded:
                 self._stakes_loaded = True
-                stakes = set()
-                all_sessions = get_poker_sessions(days=0, limit=500)
-                for s in all_sessions:
-                    if s.get("stake_level"):
-                        stakes.add(s["stake_level"])
-
                 stake_select = self.query_one("#stake_filter", Select)
                 stake_options = [("All stakes", "all")] + [
-                    (s, s) for s in sorted(stakes)
+                    (s, s) for s in get_distinct_stake_levels()
                 ]
                 stake_select.set_options(stake_options)
                 # Restore the default value after setting options
                 stake_select.value = "all"
 
-            # Populate table
-            self._populate_table()
-            self._update_summary()
+            self._show_sessions()
         finally:
             self._loading = False
 
+    def _show_sessions(self) -> None:
+        """Apply the stake filter to the loaded sessions and redisplay them."""
+        stake = self.selected_stake
+        if stake is None:
+            self.sessions = self._all_sessions
+        elif self._range_complete:
+            # The whole time range is loaded, so filter it here
+            self.sessions = [
+                s for s in self._all_sessions if s.get("stake_level") == stake
+            ]
+        else:
+            # Older sessions at this stake may have been cut off by the limit
+            self.sessions = get_poker_sessions(
+                days=self.selected_days, stake_level=stake, limit=HISTORY_LIMIT
+            )
+
+        # Populate table
+        self._populate_table()
+        self._update_summary()
+
     def _populate_table(self) -> None:
-        """Populate the data table with sessions."""
+        """Populate the data table, touching only rows that changed if possible."""
         table = self.query_one("#table", DataTable)
-        table.clear()
-
-        for session in self.sessions:
-            date_str = session.get("date", "")[:10] if session.get("date") else ""
-            stake = session.get("stake_level", "")
-            buy_in = session.get("buy_in", 0)
-            cash_out = session.get("cash_out", 0)
-            profit = session.get("profit_loss", 0)
-            duration = session.get("duration_minutes")
-            hourly = session.get("hourly_rate")
-            location = session.get("location", "") or ""
-
-            # Format duration
-            if duration:
-                hours = duration // 60
-                mins = duration % 60
-                duration_str = f"{hours}h {mins}m" if hours else f"{mins}m"
-            else:
-                duration_str = "-"
+        shown = {str(s.get("id", "")): s for s in self.sessions}
 
-            # Format profit with color
-            if profit >= 0:
-                profit_str = f"+${profit:,.2f}"
-            else:
-                profit_str = f"-${abs(profit):,.2f}"
-
-            # Format hourly rate
-            if hourly is not None:
-                if hourly >= 0:
-                    hourly_str = f"+${hourly:,.0f}"
-                else:
-                    hourly_str = f"-${abs(hourly):,.0f}"
+        # Narrowed filter or deleted rows: the new list is an in-order subset of
+        # the displayed one with unchanged data, so just drop the missing rows
+        kept = [key for key in self._displayed if key in shown]
+        unchanged = kept == list(shown) and all(
+            self._displayed[key] == session for key, session in shown.items()
+        )
+
+        # Apply all row changes in one repaint
+        with self.app.batch_update():
+            if unchanged:
+                for key in self._displayed.keys() - shown.keys():
+                    table.remove_row(key)
             else:
-                hourly_str = "-"
-
-            # Get notes and truncate if needed
-            notes = session.get("notes", "") or ""
-            notes_display = notes[:18] + ".." if len(notes) > 20 else notes
-
-            table.add_row(
-                date_str,
-                stake,
-                f"${buy_in:,.2f}",
-                f"${cash_out:,.2f}",
-                profit_str,
-                duration_str,
-                hourly_str,
-                location[:15],
-                notes_display,
-                key=str(session.get("id", "")),
-            )
+                table.clear()
+                for key, session in shown.items():
+                    table.add_row(*self._row_cells(session), key=key)
+
+        self._displayed = shown
+
+    def _row_cells(self, session: Dict[str, Any]) -> Tuple[str, ...]:
+        """Format a session as the table's cell values."""
+        date = session.get("date")
+        hourly = session.get("hourly_rate")
+
+        # Get notes and truncate if needed
+        notes = session.get("notes", "") or ""
+        notes_display = notes[:18] + ".." if len(notes) > 20 else notes
+
+        return (
+            date[:10] if date else "",
+            session.get("stake_level", ""),
+            _format_money(session.get("buy_in", 0)),
+            _format_money(session.get("cash_out", 0)),
+            _format_signed(session.get("profit_loss", 0)),
+            _format_duration(session.get("duration_minutes")),
+            _format_signed(hourly, ",.0f") if hourly is not None else "-",
+            (session.get("location", "") or "")[:15],
+            notes_display,
+        )
 
     def _update_summary(self) -> None:
-        """Update the summary statistics."""
-        if not self.sessions:
-            self.query_one("#summary_sessions", Static).update("Sessions: 0")
-            self.query_one("#summary_profit", Static).update("Total: $0.00")
-            self.query_one("#summary_hours", Static).update("Hours: 0")
-            self.query_one("#summary_rate", Static).update("Rate: $0/hr")
+        """Update the summary statistics (skipped when the totals are unchanged)."""
+        total_profit, total_minutes = _session_totals(self.sessions)
+        total_sessions = len(self.sessions)
+
+        key = (total_sessions, round(total_profit, 2), total_minutes)
+        if key == self._summary_key:
             return
+        self._summary_key = key
 
-        total_sessions = len(self.sessions)
-        total_profit = sum(s.get("profit_loss", 0) for s in self.sessions)
-        total_minutes = sum(s.get("duration_minutes", 0) or 0 for s in self.sessions)
-        total_hours = total_minutes / 60
+        # Update all four displays in one repaint
+        with self.app.batch_update():
+            if not self.sessions:
+                self._summary_sessions.update("Sessions: 0")
+                self._summary_profit.update("Total: $0.00")
+                self._summary_hours.update("Hours: 0")
+                self._summary_rate.update("Rate: $0/hr")
+                return
 
-        hourly_rate = total_profit / total_hours if total_hours > 0 else 0
+            total_hours = total_minutes / 60
+            hourly_rate = total_profit / total_hours if total_hours > 0 else 0
 
-        # Update displays
-        self.query_one("#summary_sessions", Static).update(
-            f"Sessions: {total_sessions}"
-        )
+            self._summary_sessions.update(f"Sessions: {total_sessions}")
 
-        if total_profit >= 0:
-            self.query_one("#summary_profit", Static).update(
-                f"Total: [green]+${total_profit:,.2f}[/green]"
-            )
-        else:
-            self.query_one("#summary_profit", Static).update(
-                f"Total: [red]-${abs(total_profit):,.2f}[/red]"
-            )
+            if total_profit >= 0:
+                self._summary_profit.update(
+                    f"Total: [green]+${total_profit:,.2f}[/green]"
+                )
+            else:
+                self._summary_profit.update(
+                    f"Total: [red]-${abs(total_profit):,.2f}[/red]"
+                )
 
-        self.query_one("#summary_hours", Static).update(f"Hours: {total_hours:,.1f}")
+            self._summary_hours.update(f"Hours: {total_hours:,.1f}")
 
-        if hourly_rate >= 0:
-            self.query_one("#summary_rate", Static).update(
-                f"Rate: [green]+${hourly_rate:,.2f}/hr[/green]"
-            )
-        else:
-            self.query_one("#summary_rate", Static).update(
-                f"Rate: [red]-${float(abs(hourly_rate)):,.2f}/hr[/red]"
-            )
+            if hourly_rate >= 0:
+                self._summary_rate.update(
+                    f"Rate: [green]+${hourly_rate:,.2f}/hr[/green]"
+                )
+            else:
+                self._summary_rate.update(
+                    f"Rate: [red]-${float(abs(hourly_rate)):,.2f}/hr[/red]"
+                )
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle filter changes."""
@@ -320,7 +390,7 @@ class Mode4HistoryScreen(Screen):
             self._load_sessions()
         elif select_id == "stake_filter":
             self.selected_stake = value if value != "all" else None
-            self._load_sessions()
+            self._show_sessions()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -344,25 +414,26 @@ class Mode4HistoryScreen(Screen):
 
     def action_delete_selected(self) -> None:
         """Delete the selected session."""
-        table = self.query_one("#table", DataTable)
-
-        if table.cursor_row is None or table.cursor_row < 0:
+        session_id = self._get_selected_session_id()
+        if session_id is None:
             self.notify("No session selected", severity="warning")
             return
 
-        # Get the session ID from the row key
-        row_key = table.get_row_at(table.cursor_row)
-        if row_key:
-            # The row key is the session ID
-            cursor_row = table.cursor_row
-            session_key = list(table.rows.keys())[cursor_row]
-            session_id = int(str(session_key.value))
-
-            if delete_poker_session(session_id):
-                self.notify("Session deleted")
+        if delete_poker_session(session_id):
+            self.notify("Session deleted")
+            if not self._range_complete:
+                # Re-query so the next-oldest session fills the freed slot
                 self._load_sessions()
-            else:
-                self.notify("Failed to delete session", severity="error")
+                return
+            # Drop just this row rather than re-querying the list
+            self.sessions = [s for s in self.sessions if s["id"] != session_id]
+            self._all_sessions = [
+                s for s in self._all_sessions if s["id"] != session_id
+            ]
+            self._populate_table()
+            self._update_summary()
+        else:
+            self.notify("Failed to delete session", severity="error")
 
     def _get_selected_session_id(self) -> int | None:
         """Get the ID of the currently selected session."""
@@ -372,11 +443,12 @@ class Mode4HistoryScreen(Screen):
             return None
 
         cursor_row = table.cursor_row
-        if cursor_row >= len(table.rows):
+        if cursor_row >= table.row_count:
             return None
 
-        session_key = list(table.rows.keys())[cursor_row]
-        return int(str(session_key.value))
+        # The row key is the session ID
+        row_key, _ = table.coordinate_to_cell_key(Coordinate(cursor_row, 0))
+        return int(str(row_key.value))
 
     def action_view_selected(self) -> None:
         """View the selected session details."""
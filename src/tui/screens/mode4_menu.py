@@ -1,12 +1,16 @@
 """Mode 4: Session Tracker - Menu Screen."""
 
+from typing import Any, Optional, Tuple
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container
 from textual.widgets import Header, Footer, Button, Static
 from textual.binding import Binding
 
-from ...database.service import get_session_stats
+from ...database.service import get_session_stats, get_sessions_change_key
+
+# Days covered by the quick stats panel
+QUICK_STATS_DAYS = 30
 
 
 class Mode4MenuScreen(Screen):
@@ -92,6 +96,12 @@ class Mode4MenuScreen(Screen):
         Binding("s", "stats", "Stats", show=True),
     ]
 
+    def __init__(self) -> None:
+        """Initialize the menu screen."""
+        super().__init__()
+        # Session fingerprint behind the quick stats, to skip unchanged refreshes
+        self._stats_key: Optional[Tuple[Any, ...]] = None
+
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Header()
@@ -122,18 +132,22 @@ class Mode4MenuScreen(Screen):
         self._refresh_quick_stats()
 
     def _refresh_quick_stats(self) -> None:
-        """Refresh the quick stats display."""
+        """Refresh the quick stats display if any session has changed."""
         try:
+            key = get_sessions_change_key(days=QUICK_STATS_DAYS)
+            if key == self._stats_key:
+                return
             quick_stats = self.query_one("#quick_stats", Container)
             # Get the Static widget inside the container
             stats_widget = quick_stats.query_one(Static)
             stats_widget.update(self._get_quick_stats_text())
+            self._stats_key = key
         except Exception:
-            pass  # Screen may not be fully composed yet
+            pass  # Screen may not be fully composed yet, or the DB is unavailable
 
     def _get_quick_stats_text(self) -> str:
         """Get formatted quick stats text."""
-        stats = get_session_stats(days=30)
+        stats = get_session_stats(days=QUICK_STATS_DAYS)
 
         total_sessions = stats.get("total_sessions", 0)
         total_profit = stats.get("total_profit", 0.0)
@@ -162,6 +176,7 @@ class Mode4MenuScreen(Screen):
 
     def _create_quick_stats(self) -> Static:
         """Create quick stats summary."""
+        self._stats_key = get_sessions_change_key(days=QUICK_STATS_DAYS)
         return Static(self._get_quick_stats_text(), id="stats_text")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -1,10 +1,18 @@
 """Mode 4: Session Tracker - Stats Screen."""
 
+import threading
+from collections import Counter
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
+
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal, VerticalScroll
 from textual.widgets import Header, Footer, Button, Static, Select
 from textual.binding import Binding
+from textual.timer import Timer
+from textual.worker import get_current_worker
 
 from ...database.service import get_session_stats, get_bankroll_data, get_poker_sessions
 from ...core.session_tracker import (
@@ -14,6 +22,19 @@ from ...core.session_tracker import (
     generate_ascii_graph,
 )
 
+# Seconds to wait for more refresh presses before reloading (coalesces a held "r")
+REFRESH_DELAY = 0.15
+
+# plotext draws into one global figure, so graphs are rendered one at a time
+_GRAPH_LOCK = threading.Lock()
+
+
+def _format_profit(amount: float, suffix: str = "") -> str:
+    """Format a signed dollar amount as green/red markup (e.g., "+$50.00/hr")."""
+    if amount >= 0:
+        return f"[green]+${amount:,.2f}{suffix}[/green]"
+    return f"[red]-${-amount:,.2f}{suffix}[/red]"
+
 
 class Mode4StatsScreen(Screen):
     """Stats and graphs screen."""
@@ -159,6 +180,9 @@ class Mode4StatsScreen(Screen):
         """Initialize the stats screen."""
         super().__init__()
         self.selected_days: int = 30
+        # Query results for the current refresh, keyed by (query name, days)
+        self._stats_cache: Dict[Tuple[str, int], Any] = {}
+        self._refresh_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -221,16 +245,54 @@ class Mode4StatsScreen(Screen):
 
     def _load_stats(self) -> None:
         """Load and display all statistics."""
-        self._update_overview()
-        self._update_graph()
-        self._update_streaks()
-        self._update_stake_breakdown()
-        self._update_health()
-
-    def _update_overview(self) -> None:
-        """Update overview statistics."""
-        stats = get_session_stats(days=self.selected_days)
-
+        # Start each refresh from fresh data, shared by the sections below
+        self._stats_cache.clear()
+        stats = self._cached_session_stats(self.selected_days)
+        sessions = self._cached_poker_sessions(self.selected_days)
+
+        self._update_overview(stats)
+        self._update_graph(self.selected_days)
+        self._update_streaks(sessions)
+        self._update_stake_breakdown(stats)
+        self._update_health(self._cached_poker_sessions(90))
+
+    def _cached_session_stats(self, days: int) -> Dict[str, Any]:
+        """
+        Get session stats, querying at most once per refresh.
+
+        Args:
+            days: Number of days to look back (0 for all time)
+
+        Returns:
+            Stats dict from get_session_stats
+        """
+        key = ("session_stats", days)
+        if key not in self._stats_cache:
+            self._stats_cache[key] = get_session_stats(days=days)
+        return self._stats_cache[key]
+
+    def _cached_poker_sessions(self, days: int) -> List[Dict[str, Any]]:
+        """
+        Get session records (oldest first), querying at most once per refresh.
+
+        Args:
+            days: Number of days to look back (0 for all time)
+
+        Returns:
+            Session dicts from get_poker_sessions
+        """
+        key = ("poker_sessions", days)
+        if key not in self._stats_cache:
+            self._stats_cache[key] = get_poker_sessions(days=days, chronological=True)
+        return self._stats_cache[key]
+
+    def _update_overview(self, stats: Dict[str, Any]) -> None:
+        """
+        Update overview statistics.
+
+        Args:
+            stats: Stats for the selected range, from get_session_stats
+        """
         total_sessions = stats.get("total_sessions", 0)
         total_profit = stats.get("total_profit", 0)
         total_hours = stats.get("total_hours", 0)
@@ -242,57 +304,55 @@ class Mode4StatsScreen(Screen):
         biggest_loss = stats.get("biggest_loss", 0)
         avg_session = stats.get("average_session", 0)
 
-        # Format values
-        if total_profit >= 0:
-            profit_text = f"[green]+${total_profit:,.2f}[/green]"
-        else:
-            profit_text = f"[red]-${abs(total_profit):,.2f}[/red]"
-
-        if hourly_rate >= 0:
-            hourly_text = f"[green]+${hourly_rate:,.2f}/hr[/green]"
-        else:
-            hourly_text = f"[red]-${abs(hourly_rate):,.2f}/hr[/red]"
-
-        if avg_session >= 0:
-            avg_text = f"[green]+${avg_session:,.2f}[/green]"
-        else:
-            avg_text = f"[red]-${abs(avg_session):,.2f}[/red]"
-
         text = (
             f"Total Sessions: {total_sessions}\n"
-            f"Total Profit: {profit_text}\n"
+            f"Total Profit: {_format_profit(total_profit)}\n"
             f"Total Hours: {total_hours:,.1f}\n"
-            f"Hourly Rate: {hourly_text}\n"
+            f"Hourly Rate: {_format_profit(hourly_rate, '/hr')}\n"
             f"Win Rate: {win_rate:.1f}% ({winning}W / {losing}L)\n"
-            f"Avg Session: {avg_text}\n"
+            f"Avg Session: {_format_profit(avg_session)}\n"
             f"Biggest Win: [green]+${biggest_win:,.2f}[/green]\n"
             f"Biggest Loss: [red]-${abs(biggest_loss):,.2f}[/red]"
         )
 
         self.query_one("#overview_stats", Static).update(text)
 
-    def _update_graph(self) -> None:
-        """Update the bankroll graph."""
+    @work(thread=True, exclusive=True, group="graph")
+    def _update_graph(self, days: int) -> None:
+        """
+        Build the bankroll graph off the UI thread, then show it.
+
+        Args:
+            days: Number of days to look back (0 for all time)
+        """
         # Use days=0 for all time to get all sessions
-        bankroll = get_bankroll_data(days=self.selected_days)
+        bankroll = get_bankroll_data(days=days)
         data_points = bankroll.get("data_points", [])
 
         if not data_points:
-            self.query_one("#graph_display", Static).update(
-                "[dim]No data to display - log some sessions first![/dim]"
-            )
-            return
+            graph_text = "[dim]No data to display - log some sessions first![/dim]"
+        else:
+            # Generate ASCII graph - use larger size for better readability
+            with _GRAPH_LOCK:
+                graph_lines = generate_ascii_graph(data_points, width=80, height=15)
+            graph_text = "\n".join(graph_lines)
 
-        # Generate ASCII graph - use larger size for better readability
-        graph_lines = generate_ascii_graph(data_points, width=80, height=15)
-        graph_text = "\n".join(graph_lines)
+        # Drop the result if a newer refresh has replaced this worker
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_graph, graph_text)
 
+    def _show_graph(self, graph_text: str) -> None:
+        """Show a rendered graph (or the no-data message)."""
         self.query_one("#graph_display", Static).update(graph_text)
 
-    def _update_streaks(self) -> None:
-        """Update streak and variance information."""
-        sessions = get_poker_sessions(days=self.selected_days)
-        profits = [s.get("profit_loss", 0) for s in reversed(sessions)]  # Chronological
+    def _update_streaks(self, sessions: List[Dict[str, Any]]) -> None:
+        """
+        Update streak and variance information.
+
+        Args:
+            sessions: Sessions in the selected range, oldest first
+        """
+        profits = [s.get("profit_loss", 0) for s in sessions]
 
         streak_info = calculate_streak_info(profits)
 
@@ -309,14 +369,8 @@ class Mode4StatsScreen(Screen):
         else:
             streak_text = "No streak"
 
-        # Calculate cumulative for drawdown
-        cumulative = []
-        total = 0
-        for p in profits:
-            total += p
-            cumulative.append(total)
-
-        drawdown = calculate_max_drawdown(cumulative)
+        # Running cumulative profit for drawdown
+        drawdown = calculate_max_drawdown(accumulate(profits))
         max_dd = drawdown.get("max_drawdown", 0)
         max_dd_pct = drawdown.get("max_drawdown_pct", 0)
 
@@ -329,9 +383,13 @@ class Mode4StatsScreen(Screen):
 
         self.query_one("#streak_stats", Static).update(text)
 
-    def _update_stake_breakdown(self) -> None:
-        """Update stake level breakdown."""
-        stats = get_session_stats(days=self.selected_days)
+    def _update_stake_breakdown(self, stats: Dict[str, Any]) -> None:
+        """
+        Update stake level breakdown.
+
+        Args:
+            stats: Stats for the selected range, from get_session_stats
+        """
         by_stake = stats.get("by_stake", {})
 
         if not by_stake:
@@ -347,35 +405,33 @@ class Mode4StatsScreen(Screen):
             hours = data.get("hours", 0)
             hourly = profit / hours if hours > 0 else 0
 
-            if profit >= 0:
-                profit_text = f"[green]+${profit:,.2f}[/green]"
-                hourly_text = f"[green]+${hourly:,.2f}/hr[/green]"
-            else:
-                profit_text = f"[red]-${abs(profit):,.2f}[/red]"
-                hourly_text = f"[red]-${abs(hourly):,.2f}/hr[/red]"
-
             lines.append(
-                f"{stake}: {sessions} sessions | {profit_text} | {hourly_text}"
+                f"{stake}: {sessions} sessions | {_format_profit(profit)} | "
+                f"{_format_profit(hourly, '/hr')}"
             )
 
         self.query_one("#stake_breakdown", Static).update("\n".join(lines))
 
-    def _update_health(self) -> None:
-        """Update bankroll health analysis."""
-        sessions = get_poker_sessions(days=90)
+    def _update_health(self, sessions: List[Dict[str, Any]]) -> None:
+        """
+        Update bankroll health analysis.
 
+        Args:
+            sessions: Sessions from the last 90 days, oldest first
+        """
         if not sessions:
             self.query_one("#health_stats", Static).update(
                 "[dim]Not enough data for bankroll analysis[/dim]"
             )
             return
 
-        # Get most common stake for analysis
-        stakes = [s.get("stake_level", "") for s in sessions]
-        if stakes:
-            most_common = max(set(stakes), key=stakes.count)
-        else:
-            most_common = "1/2"
+        # Count stakes (to analyse the most common) and sum profits in one pass
+        stake_counts: Counter[str] = Counter()
+        total_profit = 0.0
+        for session in sessions:
+            stake_counts[session.get("stake_level", "")] += 1
+            total_profit += session.get("profit_loss", 0)
+        most_common = stake_counts.most_common(1)[0][0]
 
         # Parse BB from stake
         try:
@@ -388,9 +444,8 @@ class Mode4StatsScreen(Screen):
         except (ValueError, IndexError):
             bb = 2.0
 
-        # Calculate current bankroll (sum of all profits as proxy)
-        total_profit = sum(s.get("profit_loss", 0) for s in sessions)
-        # Assume some starting bankroll for analysis
+        # Current bankroll uses the profit total as a proxy, assuming some
+        # starting bankroll for analysis
         estimated_bankroll = max(1000, abs(total_profit) * 3)
 
         health = analyze_bankroll_health(
@@ -450,6 +505,13 @@ class Mode4StatsScreen(Screen):
         self.app.pop_screen()
 
     def action_refresh(self) -> None:
-        """Refresh all statistics."""
+        """Refresh all statistics once a burst of refresh presses ends."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(REFRESH_DELAY, self._refresh_stats)
+
+    def _refresh_stats(self) -> None:
+        """Reload the statistics and confirm the refresh."""
+        self._refresh_timer = None
         self._load_stats()
         self.notify("Stats refreshed")
@@ -1,6 +1,8 @@
 """Mode 5: Hand History Manager - Detail Screen."""
 
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
+from rich.table import Table
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal, VerticalScroll
@@ -11,6 +13,69 @@ from ...database.service import get_hand_history_by_id, delete_hand_history
 from ...core.hand_history import format_cards, format_board_by_street
 
 
+@dataclass(slots=True, frozen=True)
+class HandView:
+    """Display-ready fields of a hand, formatted once when it is loaded."""
+
+    hero_hand: str
+    # Formatted cards per street, or None when no board was recorded
+    board_by_street: Optional[Dict[str, str]]
+    position: str
+    result_display: str
+    street: str
+    stake: str
+    pot_str: str
+    date_str: str
+    tags_display: str
+    action: str
+    notes: str
+    hand_text: str
+
+    @classmethod
+    def from_hand(cls, hand: Dict[str, Any]) -> "HandView":
+        """
+        Format a hand record for the detail screen.
+
+        Args:
+            hand: Hand record as returned by get_hand_history_by_id
+
+        Returns:
+            HandView with every field ready to display
+        """
+        result = hand.get("result", "")
+        if result == "won":
+            result_display = "[green]Won[/green]"
+        elif result == "lost":
+            result_display = "[red]Lost[/red]"
+        elif result:
+            result_display = result.capitalize()
+        else:
+            result_display = "-"
+
+        board = hand.get("board", "")
+        street = hand.get("street", "")
+        pot = hand.get("pot_size")
+        created = hand.get("created_at", "")
+        tags = hand.get("tags", [])
+
+        return cls(
+            hero_hand=format_cards(hand.get("hero_hand", "")),
+            board_by_street=format_board_by_street(board) if board else None,
+            position=hand.get("position", "") or "-",
+            result_display=result_display,
+            street=street.capitalize() if street else "-",
+            stake=hand.get("stake_level", "") or "-",
+            pot_str=f"${pot:,.2f}" if pot else "-",
+            date_str=created[:10] if created else "-",
+            tags_display=(
+                " ".join(f"[on blue] {tag} [/on blue]" for tag in tags) if tags else "-"
+            ),
+            action=hand.get("action_summary", "") or "-",
+            notes=hand.get("notes", "") or "-",
+            hand_text=hand.get("hand_text", "") or "-",
+        )
+
+
 class Mode5DetailScreen(Screen):
     """Hand detail view screen."""
 
@@ -88,29 +153,6 @@ class Mode5DetailScreen(Screen):
         margin-bottom: 1;
     }
 
-    .info_row {
-        width: 100%;
-        height: 1;
-        margin-bottom: 0;
-    }
-
-    .info_label {
-        width: 18;
-        color: $text-muted;
-    }
-
-    .info_value {
-        width: 1fr;
-    }
-
-    .won {
-        color: $success;
-    }
-
-    .lost {
-        color: $error;
-    }
-
     #tags_section {
         width: 100%;
         height: auto;
@@ -188,6 +230,7 @@ class Mode5DetailScreen(Screen):
         super().__init__()
         self.hand_id = hand_id
         self.hand: Optional[Dict[str, Any]] = None
+        self.view: Optional[HandView] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -195,26 +238,26 @@ class Mode5DetailScreen(Screen):
 
         # Load hand data
         self.hand = get_hand_history_by_id(self.hand_id)
+        view = self.view = HandView.from_hand(self.hand) if self.hand else None
 
         with Container(id="detail_container"):
             yield Static("[bold cyan]Hand Details[/bold cyan]", id="title")
 
-            if not self.hand:
+            if view is None:
                 yield Static("Hand not found", id="not_found")
                 with Horizontal(classes="button_row"):
                     yield Button("Back", id="back_btn", variant="default")
             else:
                 with VerticalScroll(id="scroll_area"):
                     # Hero hand display (large, centered)
-                    hero_hand = format_cards(self.hand.get("hero_hand", ""))
                     yield Static(
-                        f"[bold white]{hero_hand}[/bold white]", id="hero_hand_display"
+                        f"[bold white]{view.hero_hand}[/bold white]",
+                        id="hero_hand_display",
                     )
 
                     # Board by street (compact layout)
-                    board = self.hand.get("board", "")
-                    if board:
-                        board_by_street = format_board_by_street(board)
+                    board_by_street = view.board_by_street
+                    if board_by_street:
                         with Horizontal(id="board_section"):
                             with Horizontal(classes="board_street"):
                                 yield Static("Flop:", classes="street_label")
@@ -235,91 +278,37 @@ class Mode5DetailScreen(Screen):
                                     classes="street_cards",
                                 )
 
-                    # Info section - always show all fields
-                    with Container(id="info_section"):
-                        # Position
-                        position = self.hand.get("position", "") or "-"
-                        with Horizontal(classes="info_row"):
-                            yield Static("Position:", classes="info_label")
-                            yield Static(position, classes="info_value")
-
-                        # Result
-                        result = self.hand.get("result", "")
-                        if result == "won":
-                            result_display = "[green]Won[/green]"
-                            result_class = "info_value won"
-                        elif result == "lost":
-                            result_display = "[red]Lost[/red]"
-                            result_class = "info_value lost"
-                        elif result:
-                            result_display = result.capitalize()
-                            result_class = "info_value"
-                        else:
-                            result_display = "-"
-                            result_class = "info_value"
-
-                        with Horizontal(classes="info_row"):
-                            yield Static("Result:", classes="info_label")
-                            yield Static(result_display, classes=result_class)
-
-                        # Street
-                        street = self.hand.get("street", "") or "-"
-                        with Horizontal(classes="info_row"):
-                            yield Static("Street:", classes="info_label")
-                            yield Static(
-                                street.capitalize() if street != "-" else "-",
-                                classes="info_value",
-                            )
-
-                        # Stake level
-                        stake = self.hand.get("stake_level", "") or "-"
-                        with Horizontal(classes="info_row"):
-                            yield Static("Stakes:", classes="info_label")
-                            yield Static(stake, classes="info_value")
-
-                        # Pot size
-                        pot = self.hand.get("pot_size")
-                        pot_str = f"${pot:,.2f}" if pot else "-"
-                        with Horizontal(classes="info_row"):
-                            yield Static("Pot Size:", classes="info_label")
-                            yield Static(pot_str, classes="info_value")
-
-                        # Date
-                        created = self.hand.get("created_at", "")
-                        date_str = created[:10] if created else "-"
-                        with Horizontal(classes="info_row"):
-                            yield Static("Date:", classes="info_label")
-                            yield Static(date_str, classes="info_value")
+                    # Info section - always show all fields, as one table
+                    table = Table(box=None, show_header=False, padding=0, expand=True)
+                    table.add_column(width=18, style="dim")
+                    table.add_column(ratio=1)
+                    table.add_row("Position:", view.position)
+                    table.add_row("Result:", view.result_display)
+                    table.add_row("Street:", view.street)
+                    table.add_row("Stakes:", view.stake)
+                    table.add_row("Pot Size:", view.pot_str)
+                    table.add_row("Date:", view.date_str)
+                    yield Static(table, id="info_section")
 
                     # Tags section
-                    tags = self.hand.get("tags", [])
                     with Container(id="tags_section"):
                         yield Static("Tags:", classes="section_title")
-                        if tags:
-                            tags_display = " ".join(
-                                f"[on blue] {tag} [/on blue]" for tag in tags
-                            )
-                            yield Static(tags_display, classes="tags_display")
-                        else:
-                            yield Static("-", classes="tags_display")
+                        yield Static(view.tags_display, classes="tags_display")
 
                     # Action section
-                    action = self.hand.get("action_summary", "") or "-"
                     with Container(id="action_section"):
                         yield Static("Action Summary:", classes="section_title")
-                        yield Static(action, classes="section_content")
+                        yield Static(view.action, classes="section_content")
 
                     # Notes section
-                    notes = self.hand.get("notes", "") or "-"
                     with Container(id="notes_section"):
                         yield Static("Notes:", classes="section_title")
-                        yield Static(notes, classes="section_content")
+                        yield Static(view.notes, classes="section_content")
 
                     # Hand Text section (full hand history)
-                    hand_text = self.hand.get("hand_text", "") or "-"
                     with Container(id="hand_text_section"):
                         yield Static("Hand Text:", classes="section_title")
-                        yield Static(hand_text, classes="section_content")
+                        yield Static(view.hand_text, classes="section_content")
 
                 # Buttons (outside scroll area)
                 with Horizontal(classes="button_row"):
@@ -1,7 +1,13 @@
 """Tests for GTO charts and range queries."""
 
 import pytest
-from src.core.gto_charts import GTOCharts, get_gto_range, get_range_matrix
+from src.core.gto_charts import (
+    GTOCharts,
+    get_charts,
+    get_gto_range,
+    get_range_matrix,
+    matrix_hand,
+)
 
 
 class TestGTOCharts:
@@ -128,6 +134,19 @@ class TestGTOCharts:
         matrix = charts.hands_to_matrix([])
         assert all(cell is False for row in matrix for cell in row)
 
+    def test_hands_to_bitmask_matches_matrix(self, charts):
+        """Bitmask should set bit row*13+col for every matrix cell in range."""
+        hands = ["AA", "AKs", "AKo", "72o", "32s"]
+        matrix = charts.hands_to_matrix(hands)
+        mask = charts.hands_to_bitmask(hands)
+        for row in range(13):
+            for col in range(13):
+                assert bool((mask >> (row * 13 + col)) & 1) is matrix[row][col]
+
+    def test_hands_to_bitmask_empty(self, charts):
+        """Empty hand list should give a zero mask."""
+        assert charts.hands_to_bitmask([]) == 0
+
     # Matrix hand lookup tests
     def test_get_matrix_hand_pair(self, charts):
         """Should return pair for diagonal."""
@@ -150,6 +169,12 @@ class TestGTOCharts:
         assert charts.get_matrix_hand(-1, 0) == ""
         assert charts.get_matrix_hand(13, 0) == ""
 
+    def test_get_matrix_hand_matches_matrix_hand(self, charts):
+        """Method and module-level helper should agree on every cell."""
+        for row in range(13):
+            for col in range(13):
+                assert charts.get_matrix_hand(row, col) == matrix_hand(row, col)
+
     # Combo count tests
     def test_get_combo_count_pair(self, charts):
         """Pairs should have 6 combos."""
@@ -211,6 +236,12 @@ class TestConvenienceFunctions:
         matrix = get_range_matrix("INVALID", "open")
         assert matrix is None
 
+    def test_get_charts_is_shared(self):
+        """Should reuse a single loaded GTOCharts instance."""
+        charts = get_charts()
+        assert isinstance(charts, GTOCharts)
+        assert get_charts() is charts
+
 
 class TestRangeRealism:
     """Tests to verify GTO ranges are realistic."""
@@ -351,6 +351,13 @@ class TestFormatBoardByStreet:
         assert result["turn"] == ""
         assert result["river"] == ""
 
+    def test_repeat_calls_return_fresh_dicts(self):
+        """Should not let one caller's changes leak into cached results."""
+        first = format_board_by_street("Qh Jh 2c 5d 9s")
+        first["river"] = ""
+        second = format_board_by_street("Qh Jh 2c 5d 9s")
+        assert second["river"] == "9♠"
+
 
 class TestGetHandSummary:
     """Tests for get_hand_summary function."""
@@ -99,6 +99,13 @@ class TestMaxDrawdown:
         result = calculate_max_drawdown([500, 1000, 700, 800])
         assert result["max_drawdown_pct"] == pytest.approx(30.0, rel=0.1)
 
+    def test_drawdown_accepts_iterator(self):
+        """Should accept a one-shot iterator as well as a list."""
+        values = [100, 300, 500, 400, 300, 450]
+        result = calculate_max_drawdown(iter(values))
+        assert result == calculate_max_drawdown(values)
+        assert result["max_drawdown"] == 200.0
+
 
 class TestBankrollHealth:
     """Tests for bankroll health analysis."""
@@ -149,6 +156,20 @@ class TestBankrollHealth:
         # Should recommend some stakes
         assert len(result["recommended_stakes"]) > 0
 
+    def test_health_variance_independent_of_stake(self):
+        """Session variance should not change with the stake analyzed."""
+        sessions = [
+            {"profit_loss": 100},
+            {"profit_loss": -60},
+            {"profit_loss": 40},
+        ]
+        low = analyze_bankroll_health(5000, 2, sessions)
+        high = analyze_bankroll_health(5000, 5, sessions)
+        assert low["variance"] == high["variance"]
+        assert low["std_deviation"] == high["std_deviation"]
+        expected = calculate_variance([100, -60, 40])
+        assert low["variance"] == pytest.approx(expected, abs=0.01)
+
 
 class TestStreakInfo:
     """Tests for streak calculation."""
@@ -192,6 +213,23 @@ class TestStreakInfo:
         assert result["current_streak"] == 3
         assert result["current_streak_type"] == "loss"
 
+    def test_streak_trailing_break_even(self):
+        """Should keep the current streak through trailing break-even sessions."""
+        result = calculate_streak_info([-10, 100, 50, 0, 0])
+        assert result["current_streak"] == 2
+        assert result["current_streak_type"] == "win"
+
+        result = calculate_streak_info([100, 0, 50])
+        assert result["current_streak"] == 1
+        assert result["longest_win_streak"] == 1
+
+    def test_streak_accepts_generator(self):
+        """Should consume an iterator in a single pass."""
+        result = calculate_streak_info(p for p in [100, -50, -25])
+        assert result["current_streak"] == 2
+        assert result["current_streak_type"] == "loss"
+        assert result["longest_win_streak"] == 1
+
 
 class TestFormatFunctions:
     """Tests for formatting utility functions."""
@@ -37,6 +37,12 @@ class TestSpotAnalyzer:
         assert result["pot_odds"]["required_equity"] == 33.33
         assert "2" in result["pot_odds"]["ratio"]  # Should be ~2:1
 
+    def test_pot_odds_profitable_flag(self, analyzer):
+        """Should flag whether equity beats the direct pot odds."""
+        result = analyzer.analyze("As Ks", "Ah 7s 2c", pot_size=100, bet_to_call=50)
+        po = result["pot_odds"]
+        assert po["profitable"] == (result["equity"] >= po["percentage"])
+
     def test_pot_odds_different_scenarios(self, analyzer):
         """Test pot odds with different bet sizes."""
         # Small bet (25 into 100)
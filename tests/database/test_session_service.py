@@ -9,7 +9,9 @@ from src.database.service import (
     save_poker_session,
     get_poker_sessions,
     get_session_stats,
+    get_sessions_change_key,
     get_bankroll_data,
+    get_distinct_stake_levels,
     delete_poker_session,
     update_poker_session,
 )
@@ -125,6 +127,27 @@ class TestGetPokerSessions:
         assert "duration_minutes" in session
         assert "hourly_rate" in session
 
+    def test_get_sessions_chronological(self, sample_session):
+        """Should return the most recent sessions oldest first when asked."""
+        now = datetime.now(timezone.utc)
+        for days_ago in (3, 1, 2):
+            session = sample_session.copy()
+            session["date"] = now - timedelta(days=days_ago)
+            session["notes"] = f"{days_ago} days ago"
+            save_poker_session(session, user_id=TEST_USER_ID)
+
+        newest = get_poker_sessions(days=30, user_id=TEST_USER_ID)
+        assert [s["notes"] for s in newest] == [
+            "1 days ago",
+            "2 days ago",
+            "3 days ago",
+        ]
+
+        oldest = get_poker_sessions(
+            days=30, user_id=TEST_USER_ID, limit=2, chronological=True
+        )
+        assert [s["notes"] for s in oldest] == ["2 days ago", "1 days ago"]
+
     def test_get_sessions_filter_by_days(self, sample_session):
         """Should filter sessions by days."""
         # Save current session
@@ -164,6 +187,23 @@ class TestGetPokerSessions:
         assert sessions[0]["hourly_rate"] == pytest.approx(50.0, rel=0.01)
 
 
+class TestGetDistinctStakeLevels:
+    """Tests for get_distinct_stake_levels function."""
+
+    def test_no_sessions(self):
+        """Should return an empty list when nothing is logged."""
+        assert get_distinct_stake_levels(user_id=TEST_USER_ID) == []
+
+    def test_unique_sorted_stakes(self, sample_session):
+        """Should return each stake once, sorted, skipping blank stakes."""
+        for stake in ("2/5", "1/2", "2/5", ""):
+            session = sample_session.copy()
+            session["stake_level"] = stake
+            save_poker_session(session, user_id=TEST_USER_ID)
+
+        assert get_distinct_stake_levels(user_id=TEST_USER_ID) == ["1/2", "2/5"]
+
+
 class TestGetSessionStats:
     """Tests for get_session_stats function."""
 
@@ -225,6 +265,26 @@ class TestGetSessionStats:
         assert "2/5" in by_stake
         assert by_stake["2/5"]["profit"] == -100.0
 
+    def test_stats_by_stake_totals(self, sample_session):
+        """Should total sessions, profit and hours within each stake."""
+        save_poker_session(sample_session, user_id=TEST_USER_ID)  # +150, 3h
+
+        short_session = sample_session.copy()
+        short_session["cash_out"] = 150.0  # -50
+        short_session["duration_minutes"] = 90
+        save_poker_session(short_session, user_id=TEST_USER_ID)
+
+        untimed_session = sample_session.copy()
+        untimed_session["duration_minutes"] = None
+        save_poker_session(untimed_session, user_id=TEST_USER_ID)  # +150
+
+        stats = get_session_stats(days=30, user_id=TEST_USER_ID)
+        stake = stats["by_stake"]["1/2"]
+
+        assert stake["sessions"] == 3
+        assert stake["profit"] == pytest.approx(250.0)
+        assert stake["hours"] == pytest.approx(4.5)
+
     def test_stats_win_rate(self, sample_session):
         """Should calculate win rate correctly."""
         # Win
@@ -245,6 +305,34 @@ class TestGetSessionStats:
         assert stats["win_rate"] == pytest.approx(66.67, rel=0.1)
 
 
+class TestGetSessionsChangeKey:
+    """Tests for get_sessions_change_key function."""
+
+    def test_key_changes_on_save_update_delete(self, sample_session):
+        """Should change whenever the session set or its results change."""
+        empty = get_sessions_change_key(user_id=TEST_USER_ID)
+        session_id = save_poker_session(sample_session, user_id=TEST_USER_ID)
+        saved = get_sessions_change_key(user_id=TEST_USER_ID)
+        assert saved != empty
+        assert get_sessions_change_key(user_id=TEST_USER_ID) == saved
+
+        update_poker_session(session_id, {"cash_out": 100.0}, user_id=TEST_USER_ID)
+        updated = get_sessions_change_key(user_id=TEST_USER_ID)
+        assert updated != saved
+
+        delete_poker_session(session_id, user_id=TEST_USER_ID)
+        assert get_sessions_change_key(user_id=TEST_USER_ID) == empty
+
+    def test_key_respects_days_window(self, sample_session):
+        """Should ignore sessions older than the window."""
+        old_session = sample_session.copy()
+        old_session["date"] = datetime.now(timezone.utc) - timedelta(days=60)
+        save_poker_session(old_session, user_id=TEST_USER_ID)
+
+        assert get_sessions_change_key(user_id=TEST_USER_ID, days=30)[0] == 0
+        assert get_sessions_change_key(user_id=TEST_USER_ID, days=0)[0] == 1
+
+
 class TestGetBankrollData:
     """Tests for get_bankroll_data function."""
 
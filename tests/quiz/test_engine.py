@@ -106,6 +106,19 @@ class TestQuizFlow:
         if second is not None:
             assert engine._current_idx == 1
 
+    def test_peek_next_does_not_advance(self, engine):
+        """Should return the following question without moving on."""
+        upcoming = engine.peek_next()
+        assert engine._current_idx == 0
+        assert upcoming is engine.next_question()
+
+    def test_peek_next_at_last_question(self, engine):
+        """Should return None when on the last question."""
+        for _ in range(4):
+            engine.next_question()
+        assert engine.get_current_question() is not None
+        assert engine.peek_next() is None
+
     def test_next_question_at_end(self, engine):
         """Should return None at end of quiz."""
         # Advance to end
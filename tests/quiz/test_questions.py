@@ -9,6 +9,7 @@ from src.quiz.questions import (
     filter_questions,
     format_options,
     format_question_display,
+    format_topic_name,
     get_difficulties,
     get_option_from_label,
     get_topics,
@@ -198,6 +199,20 @@ class TestFormatOptions:
         assert result[3] == "D) All-in"
 
 
+class TestFormatTopicName:
+    """Tests for format_topic_name function."""
+
+    def test_snake_case_topic(self):
+        """Should replace underscores and title-case each word."""
+        assert format_topic_name("pot_odds") == "Pot Odds"
+        assert format_topic_name("game_theory") == "Game Theory"
+
+    def test_single_word_and_empty(self):
+        """Should title-case single words and pass empty strings through."""
+        assert format_topic_name("elite") == "Elite"
+        assert format_topic_name("") == ""
+
+
 class TestGetOptionFromLabel:
     """Tests for get_option_from_label function."""
 
@@ -220,6 +235,12 @@ class TestGetOptionFromLabel:
         assert get_option_from_label(options, "Z") == ""
         assert get_option_from_label(options, "C") == ""
 
+    def test_empty_and_multi_char_label(self):
+        """Should not match substrings of the letter sequence."""
+        options = ["Fold", "Call"]
+        assert get_option_from_label(options, "") == ""
+        assert get_option_from_label(options, "AB") == ""
+
 
 class TestFilterQuestions:
     """Tests for filter_questions function."""
@@ -0,0 +1,125 @@
+"""Tests for the session history screen."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import pytest
+from textual.app import App
+from textual.widgets import DataTable, Select
+
+from src.tui.screens import mode4_history
+from src.tui.screens.mode4_history import HISTORY_LIMIT, Mode4HistoryScreen
+
+
+class FakeSessionStore:
+    """In-memory stand-in for the session service functions the screen uses."""
+
+    def __init__(self, sessions: List[Dict[str, Any]]):
+        self.sessions = sessions
+
+    def get_poker_sessions(
+        self, days: int = 30, stake_level: Optional[str] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        rows = [
+            s
+            for s in self.sessions
+            if not stake_level or s["stake_level"] == stake_level
+        ]
+        rows.sort(key=lambda s: s["date"], reverse=True)
+        return [dict(s) for s in rows[:limit]]
+
+    def get_distinct_stake_levels(self) -> List[str]:
+        return sorted({s["stake_level"] for s in self.sessions})
+
+    def delete_poker_session(self, session_id: int) -> bool:
+        before = len(self.sessions)
+        self.sessions = [s for s in self.sessions if s["id"] != session_id]
+        return len(self.sessions) < before
+
+
+def _session(session_id: int, stake: str, days_ago: int) -> Dict[str, Any]:
+    """Build a session dict as returned by get_poker_sessions."""
+    date = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return {
+        "id": session_id,
+        "date": date.isoformat(),
+        "stake_level": stake,
+        "buy_in": 100.0,
+        "cash_out": 150.0,
+        "profit_loss": 50.0,
+        "duration_minutes": 60,
+        "location": "",
+        "notes": "",
+    }
+
+
+@pytest.fixture
+def full_window_store(monkeypatch):
+    """A store whose newest HISTORY_LIMIT sessions leave out older 2/5 ones."""
+    # 99 recent 1/2 sessions and one recent 2/5, then five older 2/5 sessions
+    sessions = [_session(i, "1/2", i) for i in range(1, HISTORY_LIMIT)]
+    sessions.append(_session(HISTORY_LIMIT, "2/5", 0))
+    sessions += [
+        _session(HISTORY_LIMIT + i, "2/5", HISTORY_LIMIT + i) for i in range(1, 6)
+    ]
+    store = FakeSessionStore(sessions)
+    for name in (
+        "get_poker_sessions",
+        "get_distinct_stake_levels",
+        "delete_poker_session",
+    ):
+        monkeypatch.setattr(mode4_history, name, getattr(store, name))
+    return store
+
+
+class HistoryApp(App):
+    """Minimal app hosting the history screen."""
+
+    def on_mount(self) -> None:
+        self.push_screen(Mode4HistoryScreen())
+
+
+def _run(check) -> None:
+    """Run an async check against a mounted history screen."""
+
+    async def main():
+        app = HistoryApp()
+        async with app.run_test(size=(140, 50)) as pilot:
+            await pilot.pause()
+            await check(app.screen, pilot)
+
+    asyncio.run(main())
+
+
+class TestDeleteOnFullWindow:
+    """Tests for deleting a session when the history limit was reached."""
+
+    def test_delete_backfills_next_oldest(self, full_window_store):
+        """Should re-query so the window stays full after a delete."""
+
+        async def check(screen, pilot):
+            table = screen.query_one("#table", DataTable)
+            assert table.row_count == HISTORY_LIMIT
+            table.move_cursor(row=1)
+            screen.action_delete_selected()
+            await pilot.pause()
+            assert table.row_count == HISTORY_LIMIT
+            assert len(screen.sessions) == HISTORY_LIMIT
+
+        _run(check)
+
+    def test_stake_filter_after_delete(self, full_window_store):
+        """Should still query older sessions at a stake after a delete."""
+
+        async def check(screen, pilot):
+            table = screen.query_one("#table", DataTable)
+            table.move_cursor(row=1)
+            screen.action_delete_selected()
+            await pilot.pause()
+            screen.query_one("#stake_filter", Select).value = "2/5"
+            await pilot.pause()
+            assert table.row_count == 6
+            assert len(screen.sessions) == 6
+
+        _run(check)